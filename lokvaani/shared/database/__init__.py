@@ -1,6 +1,13 @@
 """Database configuration and utilities for LokVaani services."""
 
-from .connection import get_database_engine, get_database_session, get_redis_client
+from .connection import (
+    get_database_engine,
+    get_database_session,
+    get_redis_client,
+    get_redis_binary_client,
+    warm_up_connections,
+)
+from .blob_store import AudioBlobStore
 from .models import Base, DatabaseModel
 from .migrations import run_migrations
 
@@ -8,6 +15,9 @@ __all__ = [
     "get_database_engine",
     "get_database_session", 
     "get_redis_client",
+    "get_redis_binary_client",
+    "AudioBlobStore",
+    "warm_up_connections",
     "Base",
     "DatabaseModel",
     "run_migrations",
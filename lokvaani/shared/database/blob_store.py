@@ -0,0 +1,88 @@
+"""Binary blob storage for audio payloads in LokVaani."""
+
+import logging
+from typing import Optional
+
+import redis
+import uuid6
+
+from ..config import get_settings
+from ..utils.exceptions import ExternalServiceError
+from .connection import get_redis_binary_client
+
+logger = logging.getLogger(__name__)
+
+
+class AudioBlobStore:
+    """Stores audio payloads in Redis, keyed by reference strings.
+    
+    Models such as ``VoiceInteraction`` keep only the returned key, so audio
+    bytes never pass through Pydantic validation or JSON serialization.
+    """
+    
+    KEY_PREFIX = "audio:"
+    
+    def __init__(
+        self,
+        client: Optional[redis.Redis] = None,
+        ttl_seconds: Optional[int] = None,
+        test: bool = False,
+    ):
+        self._client = client if client is not None else get_redis_binary_client(test=test)
+        self._ttl_seconds = ttl_seconds if ttl_seconds is not None else get_settings().audio_blob_ttl_seconds
+    
+    def put(self, data: bytes) -> str:
+        """
+        Store a blob and return its key.
+        
+        Args:
+            data: The raw bytes to store
+            
+        Returns:
+            Key to retrieve the blob with
+            
+        Raises:
+            ExternalServiceError: If Redis rejects the write
+        """
+        key = f"{self.KEY_PREFIX}{uuid6.uuid7().hex}"
+        try:
+            self._client.set(key, data, ex=self._ttl_seconds)
+        except redis.RedisError as e:
+            logger.error(f"Failed to store audio blob: {e}")
+            raise ExternalServiceError(f"Failed to store audio blob: {e}")
+        return key
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Fetch a blob by key.
+        
+        Args:
+            key: Key returned by ``put``
+            
+        Returns:
+            The stored bytes, or None if the key is unknown or expired
+            
+        Raises:
+            ExternalServiceError: If Redis cannot be read
+        """
+        try:
+            return self._client.get(key)
+        except redis.RedisError as e:
+            logger.error(f"Failed to fetch audio blob {key}: {e}")
+            raise ExternalServiceError(f"Failed to fetch audio blob: {e}")
+    
+    def delete(self, key: str) -> None:
+        """
+        Delete a blob by key.
+        
+        Args:
+            key: Key returned by ``put``
+            
+        Raises:
+            ExternalServiceError: If Redis cannot be written
+        """
+        try:
+            self._client.delete(key)
+        except redis.RedisError as e:
+            logger.error(f"Failed to delete audio blob {key}: {e}")
+            raise ExternalServiceError(f"Failed to delete audio blob: {e}")
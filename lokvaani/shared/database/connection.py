@@ -1,132 +1,259 @@
 """Database connection management for LokVaani."""
 
-from sqlalchemy import create_engine, Engine
-from sqlalchemy.orm import sessionmaker, Session
+import asyncio
+from contextlib import asynccontextmanager
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 import redis
-from typing import Generator, Optional
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
+from redis.retry import Retry
+from typing import AsyncIterator, Optional
 import logging
+import threading
 
-from ..config import get_database_url, get_redis_url
+from ..config import get_database_url, get_redis_url, get_settings
 
 logger = logging.getLogger(__name__)
 
 # Global engine and session factory instances
-_engine: Optional[Engine] = None
-_session_factory: Optional[sessionmaker] = None
+_engine: Optional[AsyncEngine] = None
+_session_factory: Optional[async_sessionmaker] = None
 _redis_client: Optional[redis.Redis] = None
+_redis_binary_client: Optional[redis.Redis] = None
 
+# Guards for lazy initialisation so concurrent first callers share one instance
+_engine_lock = threading.Lock()
+_session_lock = threading.Lock()
+_redis_lock = threading.Lock()
+_redis_binary_lock = threading.Lock()
 
-def get_database_engine(test: bool = False) -> Engine:
-    """Get or create the database engine."""
+
+def _to_async_url(database_url: str) -> str:
+    """Rewrite a database URL to use the async driver for its backend."""
+    if database_url.startswith("postgresql://"):
+        return database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if database_url.startswith("sqlite://"):
+        return database_url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return database_url
+
+
+def get_database_engine(test: bool = False) -> AsyncEngine:
+    """Get or create the async database engine."""
     global _engine
     
-    if _engine is None:
-        database_url = get_database_url(test=test)
+    if _engine is not None:
+        return _engine
+    
+    with _engine_lock:
+        if _engine is not None:
+            return _engine
+        
+        database_url = _to_async_url(get_database_url(test=test))
+        settings = get_settings()
         
         # Configure engine based on database type
         if database_url.startswith("sqlite"):
             # SQLite configuration for testing
-            _engine = create_engine(
+            _engine = create_async_engine(
                 database_url,
                 poolclass=StaticPool,
                 connect_args={"check_same_thread": False},
                 echo=False,  # Set to True for SQL debugging
             )
         else:
-            # PostgreSQL configuration for production
-            _engine = create_engine(
+            # PostgreSQL configuration for production. Pre-ping is off by
+            # default because under PgBouncer transaction pooling its
+            # SELECT 1 leaves server connections idle in transaction.
+            _engine = create_async_engine(
                 database_url,
-                pool_size=10,
-                max_overflow=20,
-                pool_pre_ping=True,
+                pool_size=settings.db_pool_size,
+                max_overflow=settings.db_max_overflow,
+                pool_recycle=settings.db_pool_recycle,
+                pool_pre_ping=settings.db_pool_pre_ping,
+                pool_timeout=settings.db_pool_timeout,
                 echo=False,  # Set to True for SQL debugging
             )
+            logger.info(
+                f"Database pool configured: pool_size={settings.db_pool_size}, "
+                f"max_overflow={settings.db_max_overflow}, pool_timeout={settings.db_pool_timeout}s, "
+                f"pool_recycle={settings.db_pool_recycle}s, pool_pre_ping={settings.db_pool_pre_ping}"
+            )
         
         logger.info(f"Database engine created for: {database_url}")
     
     return _engine
 
 
-def get_session_factory(test: bool = False) -> sessionmaker:
-    """Get or create the session factory."""
+def get_session_factory(test: bool = False) -> async_sessionmaker:
+    """Get or create the async session factory."""
     global _session_factory
     
-    if _session_factory is None:
-        engine = get_database_engine(test=test)
-        _session_factory = sessionmaker(
-            bind=engine,
-            autocommit=False,
-            autoflush=False,
-        )
-        logger.info("Database session factory created")
+    if _session_factory is not None:
+        return _session_factory
+    
+    with _session_lock:
+        if _session_factory is None:
+            engine = get_database_engine(test=test)
+            _session_factory = async_sessionmaker(
+                bind=engine,
+                class_=AsyncSession,
+                autoflush=False,
+                expire_on_commit=False,
+            )
+            logger.info("Database session factory created")
     
     return _session_factory
 
 
-def get_database_session(test: bool = False) -> Generator[Session, None, None]:
-    """Get a database session with automatic cleanup."""
+@asynccontextmanager
+async def get_database_session(test: bool = False) -> AsyncIterator[AsyncSession]:
+    """Get an async database session with automatic commit and cleanup."""
     session_factory = get_session_factory(test=test)
-    session = session_factory()
     
+    async with session_factory() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Database session error: {e}")
+            raise
+
+
+def _create_redis_client(test: bool, decode_responses: bool) -> redis.Redis:
+    """Create a Redis client on its own pool and verify it can connect."""
+    redis_url = get_redis_url(test=test)
+    settings = get_settings()
+    
+    # Bounded blocking pool: once every connection is checked out, burst load
+    # waits up to redis_pool_timeout for one to come back. A plain
+    # ConnectionPool raises "Too many connections" at the cap instead
+    pool = redis.BlockingConnectionPool.from_url(
+        redis_url,
+        max_connections=settings.redis_max_connections,
+        timeout=settings.redis_pool_timeout,
+        decode_responses=decode_responses,
+        socket_connect_timeout=settings.redis_connect_timeout,
+        socket_timeout=settings.redis_socket_timeout,
+        retry_on_timeout=True,
+        # Ride out network blips: retry resets and timeouts with backoff
+        retry=Retry(ExponentialBackoff(cap=1, base=0.1), retries=5),
+        retry_on_error=[RedisConnectionError, RedisTimeoutError],
+        socket_keepalive=True,
+        health_check_interval=30,
+    )
+    client = redis.Redis(connection_pool=pool)
+    
+    # Test the connection before publishing the client
     try:
-        yield session
-        session.commit()
-    except Exception as e:
-        session.rollback()
-        logger.error(f"Database session error: {e}")
+        client.ping()
+        logger.info(f"Redis client connected to: {redis_url}")
+    except redis.ConnectionError as e:
+        logger.error(f"Failed to connect to Redis: {e}")
         raise
-    finally:
-        session.close()
+    
+    return client
 
 
 def get_redis_client(test: bool = False) -> redis.Redis:
     """Get or create the Redis client."""
     global _redis_client
     
-    if _redis_client is None:
-        redis_url = get_redis_url(test=test)
-        
-        _redis_client = redis.from_url(
-            redis_url,
-            decode_responses=True,
-            socket_connect_timeout=5,
-            socket_timeout=5,
-            retry_on_timeout=True,
-            health_check_interval=30,
-        )
-        
-        # Test the connection
-        try:
-            _redis_client.ping()
-            logger.info(f"Redis client connected to: {redis_url}")
-        except redis.ConnectionError as e:
-            logger.error(f"Failed to connect to Redis: {e}")
-            raise
+    if _redis_client is not None:
+        return _redis_client
+    
+    with _redis_lock:
+        if _redis_client is None:
+            _redis_client = _create_redis_client(test=test, decode_responses=True)
     
     return _redis_client
 
 
-def close_database_connections():
+def get_redis_binary_client(test: bool = False) -> redis.Redis:
+    """Get or create a Redis client that returns raw bytes (for binary blobs)."""
+    global _redis_binary_client
+    
+    if _redis_binary_client is not None:
+        return _redis_binary_client
+    
+    with _redis_binary_lock:
+        if _redis_binary_client is None:
+            _redis_binary_client = _create_redis_client(test=test, decode_responses=False)
+    
+    return _redis_binary_client
+
+
+def _warm_redis_pool(test: bool, count: int) -> int:
+    """Open count pooled Redis connections and hand them back to the pool (blocking)."""
+    pool = get_redis_client(test=test).connection_pool
+    connections = []
+    try:
+        for _ in range(count):
+            connections.append(pool.get_connection("PING"))
+    finally:
+        # Released connections stay open, ready for the first requests
+        for conn in connections:
+            pool.release(conn)
+    return len(connections)
+
+
+async def warm_up_connections(test: bool = False) -> None:
+    """Open pooled connections ahead of traffic (call from service startup).
+    
+    Fills the database pool with ``db_pool_size`` live connections and opens
+    half of the Redis pool, so the first requests after a worker boots don't
+    each pay the TCP/TLS/auth handshake.
+    """
+    settings = get_settings()
+    engine = get_database_engine(test=test)
+    
+    # A StaticPool (SQLite) only ever holds one connection
+    if not isinstance(engine.pool, StaticPool):
+        connections = await asyncio.gather(
+            *(engine.connect() for _ in range(settings.db_pool_size))
+        )
+        # Closing returns each connection to the pool, still open
+        await asyncio.gather(*(conn.close() for conn in connections))
+        logger.info(f"Database pool warmed with {len(connections)} connections")
+    
+    # The Redis client is synchronous; keep its connects off the event loop
+    warmed = await asyncio.to_thread(_warm_redis_pool, test, settings.redis_max_connections // 2)
+    logger.info(f"Redis pool warmed with {warmed} connections")
+
+
+async def close_database_connections():
     """Close all database connections."""
-    global _engine, _session_factory, _redis_client
+    global _engine, _session_factory, _redis_client, _redis_binary_client
     
-    if _engine:
-        _engine.dispose()
-        _engine = None
+    # Detach each resource under its lock, then release it outside the lock
+    # so the (awaited) engine dispose never runs while a thread lock is held.
+    with _engine_lock:
+        engine, _engine = _engine, None
+    with _session_lock:
+        session_factory, _session_factory = _session_factory, None
+    with _redis_lock:
+        redis_client, _redis_client = _redis_client, None
+    with _redis_binary_lock:
+        redis_binary_client, _redis_binary_client = _redis_binary_client, None
+    
+    if engine:
+        await engine.dispose()
         logger.info("Database engine disposed")
     
-    if _session_factory:
-        _session_factory = None
+    if session_factory:
         logger.info("Session factory cleared")
     
-    if _redis_client:
-        _redis_client.close()
-        _redis_client = None
+    if redis_client:
+        redis_client.close()
         logger.info("Redis client closed")
+    
+    if redis_binary_client:
+        redis_binary_client.close()
+        logger.info("Redis binary client closed")
 
 
-def reset_connections():
+async def reset_connections():
     """Reset all connections (useful for testing)."""
-    close_database_connections()
-    logger.info("All database connections reset")
\ No newline at end of file
+    await close_database_connections()
+    logger.info("All database connections reset")
@@ -1,39 +1,155 @@
 """Database migration utilities for LokVaani."""
 
-from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy import exists, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from types import MappingProxyType
 import logging
 
 from .connection import get_database_engine, get_database_session
-from .models import Base
+from .models import Base, LanguageConfigDB
 
 logger = logging.getLogger(__name__)
 
 
-def create_tables(test: bool = False):
+# Default language configurations, built once at import. The top-level
+# mappings are read-only views so callers can't mutate the shared seed.
+_SEED_LANGUAGES = tuple(MappingProxyType(lang) for lang in [
+    {
+        "language_code": "en",
+        "display_name": "English",
+        "native_name": "English",
+        "is_supported": True,
+        "stt_available": True,
+        "tts_available": True,
+        "translation_available": True,
+        "voice_options": [
+            {
+                "voice_name": "en-US-Standard-A",
+                "display_name": "English (US) - Female",
+                "gender": "female",
+                "age_group": "adult",
+                "accent": "US",
+                "is_premium": False,
+                "sample_rate": 22050
+            },
+            {
+                "voice_name": "en-US-Standard-B",
+                "display_name": "English (US) - Male",
+                "gender": "male",
+                "age_group": "adult",
+                "accent": "US",
+                "is_premium": False,
+                "sample_rate": 22050
+            }
+        ],
+        "rtl_script": False,
+        "requires_special_handling": False,
+        "fallback_language": None
+    },
+    {
+        "language_code": "hi",
+        "display_name": "Hindi",
+        "native_name": "हिन्दी",
+        "is_supported": True,
+        "stt_available": True,
+        "tts_available": True,
+        "translation_available": True,
+        "voice_options": [
+            {
+                "voice_name": "hi-IN-Standard-A",
+                "display_name": "Hindi (India) - Female",
+                "gender": "female",
+                "age_group": "adult",
+                "accent": "IN",
+                "is_premium": False,
+                "sample_rate": 22050
+            }
+        ],
+        "rtl_script": False,
+        "requires_special_handling": False,
+        "fallback_language": "en"
+    },
+    {
+        "language_code": "es",
+        "display_name": "Spanish",
+        "native_name": "Español",
+        "is_supported": True,
+        "stt_available": True,
+        "tts_available": True,
+        "translation_available": True,
+        "voice_options": [
+            {
+                "voice_name": "es-ES-Standard-A",
+                "display_name": "Spanish (Spain) - Female",
+                "gender": "female",
+                "age_group": "adult",
+                "accent": "ES",
+                "is_premium": False,
+                "sample_rate": 22050
+            }
+        ],
+        "rtl_script": False,
+        "requires_special_handling": False,
+        "fallback_language": "en"
+    }
+])
+
+
+async def create_tables(test: bool = False):
     """Create all database tables."""
     engine = get_database_engine(test=test)
-    Base.metadata.create_all(bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
     logger.info("Database tables created successfully")
 
 
-def drop_tables(test: bool = False):
+async def add_timestamp_server_defaults(test: bool = False):
+    """Give existing tables the DB-side defaults for created_at/updated_at.
+    
+    These columns are filled by ``server_default`` and left out of INSERTs,
+    so tables built by an earlier ``create_all`` (without a DEFAULT) would
+    reject new rows as NOT NULL violations. Safe to run repeatedly.
+    """
+    engine = get_database_engine(test=test)
+    async with engine.begin() as conn:
+        # SQLite cannot alter a column default; its test databases are
+        # recreated rather than migrated
+        if conn.dialect.name != "postgresql":
+            logger.info(f"Skipping timestamp default migration on {conn.dialect.name}")
+            return
+        
+        quote = conn.dialect.identifier_preparer.quote
+        for table in Base.metadata.sorted_tables:
+            for column_name in ("created_at", "updated_at"):
+                if column_name in table.c:
+                    await conn.execute(text(
+                        f"ALTER TABLE {quote(table.name)} "
+                        f"ALTER COLUMN {quote(column_name)} SET DEFAULT now()"
+                    ))
+    logger.info("Timestamp column defaults in place")
+
+
+async def drop_tables(test: bool = False):
     """Drop all database tables."""
     engine = get_database_engine(test=test)
-    Base.metadata.drop_all(bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
     logger.info("Database tables dropped successfully")
 
 
-def run_migrations(test: bool = False):
+async def run_migrations(test: bool = False):
     """Run database migrations."""
     logger.info("Starting database migrations...")
     
     try:
         # Create tables
-        create_tables(test=test)
+        await create_tables(test=test)
+        
+        # Backfill DB defaults on tables created before server_default
+        await add_timestamp_server_defaults(test=test)
         
         # Seed initial data
-        seed_initial_data(test=test)
+        await seed_initial_data(test=test)
         
         logger.info("Database migrations completed successfully")
         
@@ -42,125 +158,38 @@ def run_migrations(test: bool = False):
         raise
 
 
-def seed_initial_data(test: bool = False):
+async def seed_initial_data(test: bool = False):
     """Seed initial data into the database."""
     logger.info("Seeding initial data...")
     
-    with get_database_session(test=test) as session:
+    async with get_database_session(test=test) as session:
         # Seed language configurations
-        seed_language_configs(session)
+        await seed_language_configs(session)
         
-        session.commit()
-        logger.info("Initial data seeded successfully")
+    logger.info("Initial data seeded successfully")
 
 
-def seed_language_configs(session: Session):
+async def seed_language_configs(session: AsyncSession):
     """Seed initial language configurations."""
-    from .models import LanguageConfigDB
-    
-    # Check if language configs already exist
-    existing_count = session.query(LanguageConfigDB).count()
-    if existing_count > 0:
+    # Check if language configs already exist; EXISTS stops at the first row
+    if await session.scalar(select(exists().select_from(LanguageConfigDB))):
         logger.info("Language configurations already exist, skipping seed")
         return
     
-    # Default language configurations
-    languages = [
-        {
-            "language_code": "en",
-            "display_name": "English",
-            "native_name": "English",
-            "is_supported": True,
-            "stt_available": True,
-            "tts_available": True,
-            "translation_available": True,
-            "voice_options": [
-                {
-                    "voice_name": "en-US-Standard-A",
-                    "display_name": "English (US) - Female",
-                    "gender": "female",
-                    "age_group": "adult",
-                    "accent": "US",
-                    "is_premium": False,
-                    "sample_rate": 22050
-                },
-                {
-                    "voice_name": "en-US-Standard-B",
-                    "display_name": "English (US) - Male",
-                    "gender": "male",
-                    "age_group": "adult",
-                    "accent": "US",
-                    "is_premium": False,
-                    "sample_rate": 22050
-                }
-            ],
-            "rtl_script": False,
-            "requires_special_handling": False,
-            "fallback_language": None
-        },
-        {
-            "language_code": "hi",
-            "display_name": "Hindi",
-            "native_name": "हिन्दी",
-            "is_supported": True,
-            "stt_available": True,
-            "tts_available": True,
-            "translation_available": True,
-            "voice_options": [
-                {
-                    "voice_name": "hi-IN-Standard-A",
-                    "display_name": "Hindi (India) - Female",
-                    "gender": "female",
-                    "age_group": "adult",
-                    "accent": "IN",
-                    "is_premium": False,
-                    "sample_rate": 22050
-                }
-            ],
-            "rtl_script": False,
-            "requires_special_handling": False,
-            "fallback_language": "en"
-        },
-        {
-            "language_code": "es",
-            "display_name": "Spanish",
-            "native_name": "Español",
-            "is_supported": True,
-            "stt_available": True,
-            "tts_available": True,
-            "translation_available": True,
-            "voice_options": [
-                {
-                    "voice_name": "es-ES-Standard-A",
-                    "display_name": "Spanish (Spain) - Female",
-                    "gender": "female",
-                    "age_group": "adult",
-                    "accent": "ES",
-                    "is_premium": False,
-                    "sample_rate": 22050
-                }
-            ],
-            "rtl_script": False,
-            "requires_special_handling": False,
-            "fallback_language": "en"
-        }
-    ]
-    
-    for lang_data in languages:
-        lang_config = LanguageConfigDB(**lang_data)
-        session.add(lang_config)
+    # One multi-row INSERT instead of a unit-of-work flush per object
+    await session.execute(insert(LanguageConfigDB), list(_SEED_LANGUAGES))
     
-    logger.info(f"Seeded {len(languages)} language configurations")
+    logger.info(f"Seeded {len(_SEED_LANGUAGES)} language configurations")
 
 
-def reset_database(test: bool = False):
+async def reset_database(test: bool = False):
     """Reset the database by dropping and recreating all tables."""
     logger.info("Resetting database...")
     
     try:
-        drop_tables(test=test)
-        create_tables(test=test)
-        seed_initial_data(test=test)
+        await drop_tables(test=test)
+        await create_tables(test=test)
+        await seed_initial_data(test=test)
         
         logger.info("Database reset completed successfully")
         
@@ -1,29 +1,48 @@
 """SQLAlchemy database models for LokVaani."""
 
-from sqlalchemy import Column, String, DateTime, Boolean, Text, Float, Integer, JSON
+from sqlalchemy import Column, String, DateTime, Boolean, Text, Float, Integer, JSON, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 from datetime import datetime
-import uuid
+from functools import cache
+from operator import attrgetter
+import uuid6
 
 Base = declarative_base()
 
+# Binary JSONB on PostgreSQL (no re-parse on read, GIN-indexable); plain JSON
+# elsewhere so the SQLite test database keeps working.
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
+def _uuid7_str() -> str:
+    """Generate a time-ordered UUIDv7 so primary key inserts stay append-mostly."""
+    return str(uuid6.uuid7())
+
 
 class DatabaseModel(Base):
     """Base model for all database tables."""
     
     __abstract__ = True
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    created_at = Column(DateTime, default=func.now(), nullable=False)
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+    id = Column(String, primary_key=True, default=_uuid7_str)
+    # Filled in by the database; onupdate stays client-side so UPDATEs set it on
+    # every backend without needing a Postgres trigger.
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    
+    @classmethod
+    @cache
+    def _column_accessors(cls):
+        """Column names and a matching attrgetter, built once per mapped class."""
+        names = tuple(column.name for column in cls.__table__.columns)
+        return names, attrgetter(*names)
     
     def to_dict(self):
         """Convert model to dictionary."""
-        return {
-            column.name: getattr(self, column.name)
-            for column in self.__table__.columns
-        }
+        names, getter = self._column_accessors()
+        return dict(zip(names, getter(self)))
 
 
 class UserSessionDB(DatabaseModel):
@@ -32,10 +51,10 @@ class UserSessionDB(DatabaseModel):
     __tablename__ = "user_sessions"
     
     session_id = Column(String, unique=True, nullable=False, index=True)
-    device_info = Column(JSON, nullable=False)
+    device_info = Column(JSONType, nullable=False)
     language_preference = Column(String, default="en", nullable=False)
     last_activity = Column(DateTime, default=func.now(), nullable=False)
-    conversation_context = Column(JSON, nullable=True)
+    conversation_context = Column(JSONType, nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
     
     def __repr__(self):
@@ -46,17 +65,19 @@ class VoiceInteractionDB(DatabaseModel):
     """Database model for voice interactions."""
     
     __tablename__ = "voice_interactions"
+    # Serves both session lookups and "latest interactions for a session"
+    __table_args__ = (Index("ix_voice_session_created", "session_id", "created_at"),)
     
     interaction_id = Column(String, unique=True, nullable=False, index=True)
-    session_id = Column(String, nullable=False, index=True)
+    session_id = Column(String, nullable=False)
     input_type = Column(String, nullable=False)
     processed_text = Column(Text, nullable=False)
     detected_language = Column(String, nullable=False)
     response_text = Column(Text, nullable=False)
-    voice_config = Column(JSON, nullable=True)
-    processing_metrics = Column(JSON, nullable=False)
-    audio_quality = Column(JSON, nullable=True)
-    speech_result = Column(JSON, nullable=True)
+    voice_config = Column(JSONType, nullable=True)
+    processing_metrics = Column(JSONType, nullable=False)
+    audio_quality = Column(JSONType, nullable=True)
+    speech_result = Column(JSONType, nullable=True)
     
     def __repr__(self):
         return f"<VoiceInteraction(interaction_id='{self.interaction_id}', session_id='{self.session_id}')>"
@@ -66,9 +87,10 @@ class ContentProcessingDB(DatabaseModel):
     """Database model for content processing requests."""
     
     __tablename__ = "content_processing"
+    __table_args__ = (Index("ix_content_session_created", "session_id", "created_at"),)
     
     request_id = Column(String, unique=True, nullable=False, index=True)
-    session_id = Column(String, nullable=False, index=True)
+    session_id = Column(String, nullable=False)
     original_content = Column(Text, nullable=False)
     source_language = Column(String, nullable=False)
     target_language = Column(String, nullable=False)
@@ -77,8 +99,8 @@ class ContentProcessingDB(DatabaseModel):
     content_type = Column(String, nullable=False)
     max_length = Column(Integer, nullable=True)
     preserve_technical_terms = Column(Boolean, default=False)
-    source_info = Column(JSON, nullable=True)
-    processing_result = Column(JSON, nullable=True)
+    source_info = Column(JSONType, nullable=True)
+    processing_result = Column(JSONType, nullable=True)
     
     def __repr__(self):
         return f"<ContentProcessing(request_id='{self.request_id}', session_id='{self.session_id}')>"
@@ -96,7 +118,7 @@ class LanguageConfigDB(DatabaseModel):
     stt_available = Column(Boolean, default=True, nullable=False)
     tts_available = Column(Boolean, default=True, nullable=False)
     translation_available = Column(Boolean, default=True, nullable=False)
-    voice_options = Column(JSON, nullable=False, default=list)
+    voice_options = Column(JSONType, nullable=False, default=list)
     rtl_script = Column(Boolean, default=False, nullable=False)
     requires_special_handling = Column(Boolean, default=False, nullable=False)
     fallback_language = Column(String, nullable=True)
@@ -109,8 +131,9 @@ class AccessibilityConfigDB(DatabaseModel):
     """Database model for accessibility configurations."""
     
     __tablename__ = "accessibility_configs"
+    __table_args__ = (Index("ix_accessibility_session_created", "session_id", "created_at"),)
     
-    session_id = Column(String, nullable=False, index=True)
+    session_id = Column(String, nullable=False)
     screen_reader_support = Column(Boolean, default=False, nullable=False)
     screen_reader_type = Column(String, nullable=True)
     high_contrast_mode = Column(Boolean, default=False, nullable=False)
@@ -1,14 +1,17 @@
 """Shared Pydantic models for LokVaani services."""
 
-from .base import BaseModel, TimestampedModel
+from .base import BaseModel, StrictBaseModel, FastBaseModel, FrozenModel, TimestampedModel
 from .session import UserSession, ConversationContext, DeviceInfo, UserPreferences
 from .voice import VoiceInteraction, SpeechResult, AudioQualityResult
-from .language import LanguageConfig, LanguageDetectionResult, TranslationResult
+from .language import LanguageConfig, LanguageDetectionResult, LanguageDetectionBatchResult, TranslationResult
 from .content import ContentProcessingRequest, SimplificationResult, SummaryResult
 from .accessibility import AccessibilityConfig
 
 __all__ = [
     "BaseModel",
+    "StrictBaseModel",
+    "FastBaseModel",
+    "FrozenModel",
     "TimestampedModel",
     "UserSession",
     "ConversationContext", 
@@ -19,6 +22,7 @@ __all__ = [
     "AudioQualityResult",
     "LanguageConfig",
     "LanguageDetectionResult",
+    "LanguageDetectionBatchResult",
     "TranslationResult",
     "ContentProcessingRequest",
     "SimplificationResult",
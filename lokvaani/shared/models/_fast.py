@@ -0,0 +1,151 @@
+"""msgspec mirrors of leaf models for fast Redis (de)serialization.
+
+These structs carry the same fields and constraints as their Pydantic
+counterparts but decode and validate JSON several times faster, which matters
+when hydrating cached session state. Convert at the service boundary with
+``from_pydantic()`` / ``to_pydantic()``.
+
+Structs are slotted, so the immutable scalar-only value objects below
+(``frozen=True, gc=False``) also serve as lightweight internal records for
+pipelines that allocate them in bulk, e.g. language detection candidates.
+"""
+
+from datetime import datetime
+from typing import Annotated, Any, ClassVar, Dict, List, Optional, Tuple
+
+import msgspec
+from msgspec import Meta
+
+from ..utils.clock import request_now
+from .content import ContentSource, ContentType, TermExplanation
+from .language import LanguageCandidate
+from .session import ContextualData, DeviceInfo, InputType, QueryHistory, UserPreferences
+from .voice import AudioControlRequest, AudioFormat, VoiceConfig
+
+
+class FastStruct(msgspec.Struct, kw_only=True):
+    """Base struct mirroring a Pydantic model named by ``__pydantic_model__``."""
+
+    __pydantic_model__: ClassVar[type]
+
+    @classmethod
+    def from_pydantic(cls, model: Any) -> "FastStruct":
+        """Build the struct from an instance of the mirrored Pydantic model."""
+        return cls(**model.model_dump())
+
+    def to_pydantic(self) -> Any:
+        """Convert back to the mirrored Pydantic model, validating on the way."""
+        return self.__pydantic_model__.model_validate(msgspec.structs.asdict(self))
+
+
+class QueryHistoryStruct(FastStruct, kw_only=True):
+    """Mirror of ``QueryHistory``."""
+
+    __pydantic_model__: ClassVar[type] = QueryHistory
+
+    query_id: str
+    user_input: str
+    input_type: InputType
+    detected_language: str
+    response_text: str
+    timestamp: datetime = msgspec.field(default_factory=request_now)
+    processing_time_ms: Annotated[float, Meta(ge=0)]
+
+
+class ContextualDataStruct(FastStruct, kw_only=True):
+    """Mirror of ``ContextualData``."""
+
+    __pydantic_model__: ClassVar[type] = ContextualData
+
+    current_topic: Optional[str] = None
+    mentioned_entities: List[str] = msgspec.field(default_factory=list)
+    user_intent: Optional[str] = None
+    conversation_stage: str = "initial"
+    metadata: Dict[str, Any] = msgspec.field(default_factory=dict)
+
+
+class DeviceInfoStruct(FastStruct, kw_only=True, frozen=True, gc=False):
+    """Mirror of ``DeviceInfo``."""
+
+    __pydantic_model__: ClassVar[type] = DeviceInfo
+
+    device_type: str
+    user_agent: Optional[str] = None
+    screen_width: Optional[Annotated[int, Meta(ge=1)]] = None
+    screen_height: Optional[Annotated[int, Meta(ge=1)]] = None
+    supports_audio: bool = True
+    supports_microphone: bool = True
+
+
+class UserPreferencesStruct(FastStruct, kw_only=True):
+    """Mirror of ``UserPreferences``."""
+
+    __pydantic_model__: ClassVar[type] = UserPreferences
+
+    preferred_language: str = "en"
+    input_type: InputType = InputType.VOICE
+    audio_speed_multiplier: Annotated[float, Meta(ge=0.5, le=2.0)] = 1.0
+    text_size_multiplier: Annotated[float, Meta(ge=0.8, le=2.0)] = 1.0
+    high_contrast_mode: bool = False
+    screen_reader_support: bool = False
+
+
+class ContentSourceStruct(FastStruct, kw_only=True):
+    """Mirror of ``ContentSource``."""
+
+    __pydantic_model__: ClassVar[type] = ContentSource
+
+    source_id: str
+    name: str
+    url: Optional[str] = None
+    authority_score: Annotated[float, Meta(ge=0, le=1)]
+    last_updated: Optional[datetime] = None
+    content_type: ContentType
+    is_official: bool = False
+
+
+class TermExplanationStruct(FastStruct, kw_only=True, frozen=True):
+    """Mirror of ``TermExplanation``."""
+
+    __pydantic_model__: ClassVar[type] = TermExplanation
+
+    term: str
+    definition: str
+    context: Optional[str] = None
+    examples: Tuple[str, ...] = ()
+    related_terms: Tuple[str, ...] = ()
+
+
+class VoiceConfigStruct(FastStruct, kw_only=True, frozen=True, gc=False):
+    """Mirror of ``VoiceConfig``."""
+
+    __pydantic_model__: ClassVar[type] = VoiceConfig
+
+    language_code: str
+    voice_name: Optional[str] = None
+    speaking_rate: Annotated[float, Meta(ge=0.25, le=4.0)] = 1.0
+    pitch: Annotated[float, Meta(ge=-20.0, le=20.0)] = 0.0
+    volume_gain_db: Annotated[float, Meta(ge=-96.0, le=16.0)] = 0.0
+    audio_format: AudioFormat = AudioFormat.MP3
+    sample_rate: int = 22050
+
+
+class LanguageCandidateStruct(FastStruct, kw_only=True, frozen=True, gc=False):
+    """Mirror of ``LanguageCandidate``."""
+
+    __pydantic_model__: ClassVar[type] = LanguageCandidate
+
+    language_code: str
+    language_name: str
+    confidence: Annotated[float, Meta(ge=0, le=1)]
+
+
+class AudioControlRequestStruct(FastStruct, kw_only=True, frozen=True, gc=False):
+    """Mirror of ``AudioControlRequest``."""
+
+    __pydantic_model__: ClassVar[type] = AudioControlRequest
+
+    interaction_id: str
+    action: str
+    speed_multiplier: Optional[Annotated[float, Meta(ge=0.25, le=4.0)]] = None
+    position_seconds: Optional[Annotated[float, Meta(ge=0)]] = None
@@ -1,10 +1,10 @@
 """Accessibility-related models for LokVaani."""
 
-from pydantic import Field
-from typing import Optional, List, Dict
+from pydantic import ConfigDict, Field, PrivateAttr, model_validator
+from typing import Optional, List, Dict, FrozenSet, Tuple
 from enum import Enum
 
-from .base import BaseModel
+from .base import BaseModel, FastBaseModel
 
 
 class ContrastLevel(str, Enum):
@@ -32,7 +32,14 @@ class NavigationMode(str, Enum):
 
 
 class AccessibilityConfig(BaseModel):
-    """Accessibility configuration for users."""
+    """Accessibility configuration for users.
+    
+    Instances are immutable; use ``model_copy(update=...)`` to derive a
+    changed configuration.
+    """
+    
+    # Read far more often than written, so skip per-assignment validation
+    model_config = ConfigDict(frozen=True)
     
     # Screen reader support
     screen_reader_support: bool = Field(False, description="Whether screen reader support is enabled")
@@ -66,6 +73,8 @@ class AccessibilityConfig(BaseModel):
     
     def get_text_size_pixels(self, base_size: int = 16) -> int:
         """Calculate text size in pixels based on multiplier."""
+        # One float multiply is cheaper than any memo lookup; quantizing the
+        # multiplier first changed results through float error
         return int(base_size * self.text_size_multiplier)
     
     def requires_alternative_indicators(self) -> bool:
@@ -89,7 +98,7 @@ class AccessibilityFeature(BaseModel):
     
     # WCAG compliance information
     wcag_level: Optional[str] = Field(None, description="WCAG compliance level (A, AA, AAA)")
-    wcag_criteria: List[str] = Field(default_factory=list, description="WCAG success criteria addressed")
+    wcag_criteria: Tuple[str, ...] = Field(default_factory=tuple, description="WCAG success criteria addressed")
 
 
 class AccessibilityReport(BaseModel):
@@ -97,7 +106,7 @@ class AccessibilityReport(BaseModel):
     
     overall_score: float = Field(..., ge=0, le=100, description="Overall accessibility score")
     wcag_compliance_level: str = Field(..., description="Highest WCAG level achieved")
-    supported_features: List[AccessibilityFeature] = Field(..., description="List of supported accessibility features")
+    supported_features: Tuple[AccessibilityFeature, ...] = Field(..., description="Supported accessibility features")
     missing_features: List[str] = Field(default_factory=list, description="List of missing accessibility features")
     recommendations: List[str] = Field(default_factory=list, description="Recommendations for improvement")
     
@@ -106,13 +115,27 @@ class AccessibilityReport(BaseModel):
     level_aa_compliance: bool = Field(..., description="Whether WCAG Level AA is achieved")
     level_aaa_compliance: bool = Field(..., description="Whether WCAG Level AAA is achieved")
     
+    # Lookup indexes over supported_features, rebuilt whenever it is validated
+    _feature_ids: Optional[FrozenSet[str]] = PrivateAttr(default=None)
+    _features_by_category: Optional[Dict[str, List[AccessibilityFeature]]] = PrivateAttr(default=None)
+    
+    @model_validator(mode="after")
+    def _index_features(self) -> "AccessibilityReport":
+        """Index supported features by id and category."""
+        by_category: Dict[str, List[AccessibilityFeature]] = {}
+        for feature in self.supported_features:
+            by_category.setdefault(feature.category, []).append(feature)
+        self._features_by_category = by_category
+        self._feature_ids = frozenset(feature.feature_id for feature in self.supported_features)
+        return self
+    
     def get_features_by_category(self, category: str) -> List[AccessibilityFeature]:
         """Get accessibility features by category."""
-        return [feature for feature in self.supported_features if feature.category == category]
+        return list(self._private_index("_features_by_category", self._index_features).get(category, ()))
     
     def is_feature_supported(self, feature_id: str) -> bool:
         """Check if a specific accessibility feature is supported."""
-        return any(feature.feature_id == feature_id for feature in self.supported_features)
+        return feature_id in self._private_index("_feature_ids", self._index_features)
 
 
 class AccessibilityRequest(BaseModel):
@@ -123,7 +146,7 @@ class AccessibilityRequest(BaseModel):
     apply_immediately: bool = Field(True, description="Whether to apply changes immediately")
 
 
-class AccessibilityResponse(BaseModel):
+class AccessibilityResponse(FastBaseModel):
     """Response for accessibility configuration operations."""
     
     success: bool = Field(..., description="Whether the configuration was applied successfully")
@@ -1,13 +1,79 @@
 """Base models for LokVaani services."""
 
-from pydantic import BaseModel as PydanticBaseModel, Field, ConfigDict
-from datetime import datetime
-from typing import Optional
+from pydantic import AfterValidator, BaseModel as PydanticBaseModel, Field, ConfigDict
+from datetime import datetime, timezone
+from typing import Annotated, Any, Callable, Mapping, Optional, Type, TypeVar
+import sys
 import uuid
 
+from ..utils.clock import request_now
 
-class BaseModel(PydanticBaseModel):
-    """Base model with common configuration."""
+
+def utc_now() -> datetime:
+    """Get the current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+ModelT = TypeVar("ModelT", bound="_LokVaaniModel")
+
+# String drawn from a small vocabulary (codes, categories); interned so
+# instances share one object per distinct value
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+
+class _LokVaaniModel(PydanticBaseModel):
+    """Shared helpers for the LokVaani model roots."""
+    
+    @classmethod
+    def construct_unvalidated(cls: Type[ModelT], **data: Any) -> ModelT:
+        """Build an instance from already-validated values, skipping validation.
+        
+        Wraps ``model_construct``: defaults are filled in but nothing is type
+        checked or coerced, so nested models must already be model instances.
+        Use it only for trusted internal assembly (values read back from our
+        own storage, filtered copies of existing models), never for API input.
+        """
+        return cls.model_construct(**data)
+    
+    def _private_index(self, name: str, build: Callable[[], Any]) -> Any:
+        """Get a private lookup index, building it if validation was skipped.
+        
+        Reads ``__pydantic_private__`` directly: plain private attribute access
+        goes through the much slower ``BaseModel.__getattr__``. ``build`` is
+        the after-validator that fills the index; it only runs for instances
+        made by ``construct_unvalidated`` or ``model_copy(update=...)``.
+        """
+        private = self.__pydantic_private__
+        if private[name] is None:
+            build()
+        return private[name]
+    
+    def model_copy(self: ModelT, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False) -> ModelT:
+        """Copy the model, dropping private state derived from the old fields.
+        
+        ``update`` is applied without validation, so after-validators that
+        build private indexes do not run; clearing them makes
+        ``_private_index`` rebuild from the copy's own fields on next use.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        private = copied.__pydantic_private__
+        if update and private:
+            for name in private:
+                private[name] = None
+        return copied
+    
+    def to_json_bytes(self, **kwargs: Any) -> bytes:
+        """Serialize to UTF-8 JSON bytes.
+        
+        Calls the compiled pydantic-core serializer directly, skipping the
+        ``str`` decode done by ``model_dump_json``. Accepts the same keyword
+        options (``exclude_none``, ``by_alias``, ...).
+        """
+        return self.__pydantic_serializer__.to_json(self, **kwargs)
+
+
+class StrictBaseModel(_LokVaaniModel):
+    """Base model for API ingress with full validation."""
     
     model_config = ConfigDict(
         # Enable validation on assignment
@@ -23,15 +89,47 @@ class BaseModel(PydanticBaseModel):
     )
 
 
+class FastBaseModel(_LokVaaniModel):
+    """Base model for internal DTOs built from already-validated data.
+    
+    Fields are still validated on construction, but assignments and defaults
+    are not re-validated and unknown fields are ignored. When combined with
+    ``TimestampedModel``/``IdentifiedModel``, list it as the last base so its
+    configuration takes precedence.
+    """
+    
+    model_config = ConfigDict(
+        validate_assignment=False,
+        use_enum_values=True,
+        populate_by_name=True,
+        validate_default=False,
+        extra="ignore",
+    )
+
+
+class FrozenModel(StrictBaseModel):
+    """Base model for immutable leaf value objects.
+    
+    Instances are hashable and cannot be changed after construction, so
+    assignment validation is moot; unknown fields are still rejected.
+    """
+    
+    model_config = ConfigDict(frozen=True, extra="forbid", validate_assignment=False)
+
+
+# Models default to strict validation unless they opt into FastBaseModel
+BaseModel = StrictBaseModel
+
+
 class TimestampedModel(BaseModel):
     """Base model with timestamp fields."""
     
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=request_now)
     updated_at: Optional[datetime] = None
     
     def update_timestamp(self) -> None:
         """Update the updated_at timestamp."""
-        self.updated_at = datetime.utcnow()
+        self.updated_at = utc_now()
 
 
 class IdentifiedModel(BaseModel):
@@ -1,11 +1,12 @@
 """Content processing models for LokVaani."""
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr, model_validator
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from enum import Enum
 
-from .base import BaseModel, TimestampedModel, IdentifiedModel, ProcessingMetrics
+from .base import BaseModel, FrozenModel, TimestampedModel, IdentifiedModel, ProcessingMetrics
+from .language import LangCode
 
 
 class AudienceLevel(str, Enum):
@@ -33,14 +34,14 @@ class ContentType(str, Enum):
     EDUCATIONAL = "educational"
 
 
-class TermExplanation(BaseModel):
+class TermExplanation(FrozenModel):
     """Explanation of a technical term."""
     
     term: str = Field(..., description="The technical term")
     definition: str = Field(..., description="Plain language definition")
     context: Optional[str] = Field(None, description="Context where the term appears")
-    examples: List[str] = Field(default_factory=list, description="Usage examples")
-    related_terms: List[str] = Field(default_factory=list, description="Related technical terms")
+    examples: Tuple[str, ...] = Field(default_factory=tuple, description="Usage examples")
+    related_terms: Tuple[str, ...] = Field(default_factory=tuple, description="Related technical terms")
 
 
 class ContentSource(BaseModel):
@@ -61,8 +62,8 @@ class ContentProcessingRequest(TimestampedModel, IdentifiedModel):
     request_id: str = Field(..., description="Unique request identifier")
     session_id: str = Field(..., description="Associated session identifier")
     original_content: str = Field(..., description="Original content to process")
-    source_language: str = Field(..., description="Language of the original content")
-    target_language: str = Field(..., description="Target language for response")
+    source_language: LangCode = Field(..., description="Language of the original content")
+    target_language: LangCode = Field(..., description="Target language for response")
     simplification_level: AudienceLevel = Field(AudienceLevel.BEGINNER, description="Target audience level")
     requested_format: ResponseFormat = Field(ResponseFormat.BOTH, description="Requested response format")
     content_type: ContentType = Field(ContentType.INFORMATIONAL, description="Type of content being processed")
@@ -77,16 +78,25 @@ class SimplificationResult(BaseModel):
     simplified_text: str = Field(..., description="Simplified version of the content")
     complexity_reduction: float = Field(..., ge=0, le=1, description="Measure of complexity reduction achieved")
     preserved_key_points: List[str] = Field(..., description="Key information points preserved")
-    technical_terms_explained: List[TermExplanation] = Field(default_factory=list, description="Technical terms with explanations")
+    technical_terms_explained: Tuple[TermExplanation, ...] = Field(default_factory=tuple, description="Technical terms with explanations")
     readability_score: Optional[float] = Field(None, ge=0, le=100, description="Readability score of simplified text")
     processing_metrics: ProcessingMetrics = Field(..., description="Processing performance metrics")
     
+    # Lowercased term lookup over technical_terms_explained, rebuilt whenever it is validated
+    _term_index: Optional[Dict[str, TermExplanation]] = PrivateAttr(default=None)
+    
+    @model_validator(mode="after")
+    def _index_terms(self) -> "SimplificationResult":
+        """Index explained terms by lowercased term, keeping the first occurrence."""
+        index: Dict[str, TermExplanation] = {}
+        for explanation in self.technical_terms_explained:
+            index.setdefault(explanation.term.lower(), explanation)
+        self._term_index = index
+        return self
+    
     def get_explanation_for_term(self, term: str) -> Optional[TermExplanation]:
         """Get explanation for a specific technical term."""
-        for explanation in self.technical_terms_explained:
-            if explanation.term.lower() == term.lower():
-                return explanation
-        return None
+        return self._private_index("_term_index", self._index_terms).get(term.lower())
 
 
 class SummaryResult(BaseModel):
@@ -126,7 +136,7 @@ class ContentResponse(BaseModel):
     
     request_id: str = Field(..., description="Original request identifier")
     processed_content: str = Field(..., description="Final processed content")
-    content_language: str = Field(..., description="Language of the processed content")
+    content_language: LangCode = Field(..., description="Language of the processed content")
     simplification_result: Optional[SimplificationResult] = Field(None, description="Simplification details")
     summary_result: Optional[SummaryResult] = Field(None, description="Summary details if requested")
     explanation_result: Optional[ExplanationResult] = Field(None, description="Term explanations if requested")
@@ -140,5 +150,5 @@ class ContentResponse(BaseModel):
     
     def has_explanations(self) -> bool:
         """Check if response includes term explanations."""
-        return (self.explanation_result is not None and 
-                len(self.explanation_result.explanations) > 0)
\ No newline at end of file
+        explanation_result = self.explanation_result
+        return explanation_result is not None and bool(explanation_result.explanations)
\ No newline at end of file
@@ -1,16 +1,20 @@
 """Language processing models for LokVaani."""
 
-from pydantic import Field
-from typing import Optional, List, Dict
+import numpy as np
+from pydantic import ConfigDict, Field, PrivateAttr, field_serializer, field_validator, model_validator
+from typing import Any, Optional, List, Dict, Tuple
 from enum import Enum
 
-from .base import BaseModel, ProcessingMetrics
+from .base import BaseModel, FrozenModel, InternedStr, ProcessingMetrics
 
+# Language codes repeat across nearly every model instance
+LangCode = InternedStr
 
-class LanguageCandidate(BaseModel):
+
+class LanguageCandidate(FrozenModel):
     """A candidate language with confidence score."""
     
-    language_code: str = Field(..., description="ISO 639-1 language code")
+    language_code: LangCode = Field(..., description="ISO 639-1 language code")
     language_name: str = Field(..., description="Human-readable language name")
     confidence: float = Field(..., ge=0, le=1, description="Confidence score for this language")
 
@@ -18,7 +22,7 @@ class LanguageCandidate(BaseModel):
 class LanguageDetectionResult(BaseModel):
     """Result of language detection."""
     
-    primary_language: str = Field(..., description="Most likely language code")
+    primary_language: LangCode = Field(..., description="Most likely language code")
     confidence: float = Field(..., ge=0, le=1, description="Confidence in primary language detection")
     alternative_languages: List[LanguageCandidate] = Field(default_factory=list, description="Alternative language candidates")
     processing_metrics: ProcessingMetrics = Field(..., description="Processing performance metrics")
@@ -28,24 +32,147 @@ class LanguageDetectionResult(BaseModel):
         return self.confidence >= threshold
 
 
+class LanguageDetectionBatchResult(BaseModel):
+    """Language detection results for a batch of texts, stored column-wise.
+    
+    Candidates for text ``i`` occupy ``candidate_offsets[i]:candidate_offsets[i + 1]``
+    of the candidate columns, so a batch holds a handful of arrays instead of
+    one model per candidate. Confidences are float64 arrays, so values and
+    threshold comparisons match the per-text models exactly; build ``LanguageDetectionResult`` objects only at the edge.
+    """
+    
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    
+    primary_languages: List[str] = Field(..., description="Most likely language code per text")
+    primary_confidences: np.ndarray = Field(..., description="Primary detection confidence per text")
+    candidate_offsets: np.ndarray = Field(..., description="Start of each text's candidates, plus a final end offset")
+    candidate_codes: List[str] = Field(default_factory=list, description="Alternative candidate language codes")
+    candidate_names: List[str] = Field(default_factory=list, description="Alternative candidate language names")
+    candidate_confidences: np.ndarray = Field(
+        default_factory=lambda: np.empty(0, dtype=np.float64),
+        description="Alternative candidate confidence scores",
+    )
+    processing_metrics: ProcessingMetrics = Field(..., description="Processing performance metrics for the batch")
+    
+    @field_validator("primary_confidences", "candidate_confidences", mode="before")
+    @classmethod
+    def _as_confidence_array(cls, value: Any) -> np.ndarray:
+        """Store confidences as a contiguous float64 array in [0, 1]."""
+        array = np.ascontiguousarray(value, dtype=np.float64)
+        if array.ndim != 1:
+            raise ValueError("confidences must be one-dimensional")
+        if array.size and (array.min() < 0 or array.max() > 1):
+            raise ValueError("confidences must be between 0 and 1")
+        return array
+    
+    @field_validator("candidate_offsets", mode="before")
+    @classmethod
+    def _as_offset_array(cls, value: Any) -> np.ndarray:
+        """Store offsets as a non-decreasing int64 array."""
+        array = np.ascontiguousarray(value, dtype=np.int64)
+        if array.ndim != 1 or array.size == 0:
+            raise ValueError("candidate_offsets must be a non-empty one-dimensional array")
+        if array[0] != 0 or (np.diff(array) < 0).any():
+            raise ValueError("candidate_offsets must start at 0 and be non-decreasing")
+        return array
+    
+    @model_validator(mode="after")
+    def _check_columns(self) -> "LanguageDetectionBatchResult":
+        """Check that the per-text and per-candidate columns line up."""
+        num_texts = len(self.primary_languages)
+        if len(self.primary_confidences) != num_texts or len(self.candidate_offsets) != num_texts + 1:
+            raise ValueError("per-text columns must have one entry per text")
+        num_candidates = int(self.candidate_offsets[-1])
+        if not (len(self.candidate_codes) == len(self.candidate_names) == len(self.candidate_confidences) == num_candidates):
+            raise ValueError("candidate columns must match the final candidate offset")
+        return self
+    
+    @field_serializer("primary_confidences", "candidate_offsets", "candidate_confidences")
+    def _serialize_array(self, array: np.ndarray) -> List[Any]:
+        """Expose arrays as plain lists."""
+        return array.tolist()
+    
+    @classmethod
+    def from_results(
+        cls,
+        results: List[LanguageDetectionResult],
+        processing_metrics: ProcessingMetrics,
+    ) -> "LanguageDetectionBatchResult":
+        """Pack individual detection results into columns."""
+        offsets = [0]
+        codes: List[str] = []
+        names: List[str] = []
+        confidences: List[float] = []
+        for result in results:
+            for candidate in result.alternative_languages:
+                codes.append(candidate.language_code)
+                names.append(candidate.language_name)
+                confidences.append(candidate.confidence)
+            offsets.append(len(codes))
+        return cls(
+            primary_languages=[result.primary_language for result in results],
+            primary_confidences=[result.confidence for result in results],
+            candidate_offsets=offsets,
+            candidate_codes=codes,
+            candidate_names=names,
+            candidate_confidences=confidences,
+            processing_metrics=processing_metrics,
+        )
+    
+    def __len__(self) -> int:
+        """Number of texts in the batch."""
+        return len(self.primary_languages)
+    
+    def confident_mask(self, threshold: float = 0.8) -> np.ndarray:
+        """Boolean mask of texts whose primary confidence meets threshold."""
+        return self.primary_confidences >= threshold
+    
+    def to_individual_results(self, threshold: float = 0.0) -> List[LanguageDetectionResult]:
+        """Expand into per-text results, keeping candidates at or above threshold."""
+        keep = np.flatnonzero(self.candidate_confidences >= threshold)
+        # Kept candidates per text, found by locating text boundaries in the kept indices
+        bounds = np.searchsorted(keep, self.candidate_offsets).tolist()
+        kept = keep.tolist()
+        confidences = self.candidate_confidences.tolist()
+        primary_confidences = self.primary_confidences.tolist()
+        
+        results = []
+        for i, primary_language in enumerate(self.primary_languages):
+            candidates = [
+                LanguageCandidate(
+                    language_code=self.candidate_codes[j],
+                    language_name=self.candidate_names[j],
+                    confidence=confidences[j],
+                )
+                for j in kept[bounds[i]:bounds[i + 1]]
+            ]
+            results.append(LanguageDetectionResult(
+                primary_language=primary_language,
+                confidence=primary_confidences[i],
+                alternative_languages=candidates,
+                processing_metrics=self.processing_metrics,
+            ))
+        return results
+
+
 class TranslationResult(BaseModel):
     """Result of text translation."""
     
     translated_text: str = Field(..., description="Translated text")
-    source_language: str = Field(..., description="Detected source language")
-    target_language: str = Field(..., description="Target language for translation")
+    source_language: LangCode = Field(..., description="Detected source language")
+    target_language: LangCode = Field(..., description="Target language for translation")
     confidence: float = Field(..., ge=0, le=1, description="Translation confidence score")
     alternative_translations: List[str] = Field(default_factory=list, description="Alternative translation options")
     processing_metrics: ProcessingMetrics = Field(..., description="Processing performance metrics")
 
 
-class VoiceOption(BaseModel):
+class VoiceOption(FrozenModel):
     """Available voice option for a language."""
     
     voice_name: str = Field(..., description="Unique voice identifier")
     display_name: str = Field(..., description="Human-readable voice name")
-    gender: str = Field(..., description="Voice gender (male, female, neutral)")
-    age_group: str = Field(..., description="Voice age group (child, adult, elderly)")
+    gender: InternedStr = Field(..., description="Voice gender (male, female, neutral)")
+    age_group: InternedStr = Field(..., description="Voice age group (child, adult, elderly)")
     accent: Optional[str] = Field(None, description="Voice accent or regional variant")
     is_premium: bool = Field(False, description="Whether this is a premium voice")
     sample_rate: int = Field(22050, description="Default sample rate for this voice")
@@ -54,45 +181,54 @@ class VoiceOption(BaseModel):
 class LanguageConfig(BaseModel):
     """Configuration for a supported language."""
     
-    language_code: str = Field(..., description="ISO 639-1 language code")
+    language_code: LangCode = Field(..., description="ISO 639-1 language code")
     display_name: str = Field(..., description="Human-readable language name")
     native_name: str = Field(..., description="Language name in its native script")
     is_supported: bool = Field(True, description="Whether this language is currently supported")
     stt_available: bool = Field(True, description="Whether speech-to-text is available")
     tts_available: bool = Field(True, description="Whether text-to-speech is available")
     translation_available: bool = Field(True, description="Whether translation is available")
-    voice_options: List[VoiceOption] = Field(default_factory=list, description="Available voice options")
+    voice_options: Tuple[VoiceOption, ...] = Field(default_factory=tuple, description="Available voice options")
     
     # Language-specific settings
     rtl_script: bool = Field(False, description="Whether language uses right-to-left script")
     requires_special_handling: bool = Field(False, description="Whether language requires special processing")
-    fallback_language: Optional[str] = Field(None, description="Fallback language if processing fails")
+    fallback_language: Optional[LangCode] = Field(None, description="Fallback language if processing fails")
     
-    def get_default_voice(self) -> Optional[VoiceOption]:
-        """Get the default voice option for this language."""
-        if not self.voice_options:
-            return None
+    # Voice lookups over voice_options, rebuilt whenever it is validated
+    _voices_by_name: Optional[Dict[str, VoiceOption]] = PrivateAttr(default=None)
+    _default_voice: Optional[VoiceOption] = PrivateAttr(default=None)
+    
+    @model_validator(mode="after")
+    def _index_voices(self) -> "LanguageConfig":
+        """Index voice options by name and pick the default voice."""
+        index: Dict[str, VoiceOption] = {}
+        for voice in self.voice_options:
+            index.setdefault(voice.voice_name, voice)
+        self._voices_by_name = index
         
         # Prefer non-premium voices as default
-        non_premium = [v for v in self.voice_options if not v.is_premium]
-        if non_premium:
-            return non_premium[0]
-        
-        return self.voice_options[0]
+        self._default_voice = next(
+            (voice for voice in self.voice_options if not voice.is_premium),
+            self.voice_options[0] if self.voice_options else None,
+        )
+        return self
+    
+    def get_default_voice(self) -> Optional[VoiceOption]:
+        """Get the default voice option for this language."""
+        self._private_index("_voices_by_name", self._index_voices)
+        return self.__pydantic_private__["_default_voice"]
     
     def get_voice_by_name(self, voice_name: str) -> Optional[VoiceOption]:
         """Get a specific voice option by name."""
-        for voice in self.voice_options:
-            if voice.voice_name == voice_name:
-                return voice
-        return None
+        return self._private_index("_voices_by_name", self._index_voices).get(voice_name)
 
 
 class LanguagePreferenceRequest(BaseModel):
     """Request to set language preference."""
     
     session_id: str = Field(..., description="Session identifier")
-    language_code: str = Field(..., description="Preferred language code")
+    language_code: LangCode = Field(..., description="Preferred language code")
     explicit_request: bool = Field(True, description="Whether this was an explicit user request")
 
 
@@ -100,7 +236,7 @@ class LanguagePreferenceResponse(BaseModel):
     """Response for language preference operations."""
     
     success: bool = Field(..., description="Whether the preference was set successfully")
-    current_language: str = Field(..., description="Current language setting")
+    current_language: LangCode = Field(..., description="Current language setting")
     available_languages: List[str] = Field(..., description="List of available language codes")
     error_message: Optional[str] = Field(None, description="Error message if operation failed")
 
@@ -108,22 +244,22 @@ class LanguagePreferenceResponse(BaseModel):
 class MultilingualText(BaseModel):
     """Text content in multiple languages."""
     
-    texts: Dict[str, str] = Field(..., description="Text content keyed by language code")
-    primary_language: str = Field(..., description="Primary language of the content")
+    texts: Dict[LangCode, str] = Field(..., description="Text content keyed by language code")
+    primary_language: LangCode = Field(..., description="Primary language of the content")
     
     def get_text(self, language_code: str, fallback: bool = True) -> Optional[str]:
         """Get text in specified language with optional fallback."""
-        if language_code in self.texts:
-            return self.texts[language_code]
+        texts = self.texts
+        text = texts.get(language_code)
+        if text is not None or not fallback:
+            return text
         
-        if fallback and self.primary_language in self.texts:
-            return self.texts[self.primary_language]
+        text = texts.get(self.primary_language)
+        if text is not None:
+            return text
         
         # Return any available text as last resort
-        if fallback and self.texts:
-            return next(iter(self.texts.values()))
-        
-        return None
+        return next(iter(texts.values()), None)
     
     def add_translation(self, language_code: str, text: str) -> None:
         """Add a translation for the specified language."""
@@ -1,11 +1,19 @@
 """Session-related models for LokVaani."""
 
-from pydantic import Field
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+from pydantic import Field, field_serializer, field_validator
+from collections import deque
+from datetime import datetime, timezone
+from itertools import islice
+import time
+from typing import Optional, List, Dict, Any, Deque
 from enum import Enum
 
-from .base import BaseModel, TimestampedModel, IdentifiedModel
+from ..utils.clock import request_now
+from .base import BaseModel, FastBaseModel, TimestampedModel, IdentifiedModel, InternedStr, utc_now
+from .language import LangCode
+
+# Maximum number of queries retained in a conversation's history
+MAX_QUERY_HISTORY = 50
 
 
 class InputType(str, Enum):
@@ -17,7 +25,7 @@ class InputType(str, Enum):
 class DeviceInfo(BaseModel):
     """Information about the user's device."""
     
-    device_type: str = Field(..., description="Type of device (mobile, desktop, tablet)")
+    device_type: InternedStr = Field(..., description="Type of device (mobile, desktop, tablet)")
     user_agent: Optional[str] = Field(None, description="Browser user agent string")
     screen_width: Optional[int] = Field(None, ge=1, description="Screen width in pixels")
     screen_height: Optional[int] = Field(None, ge=1, description="Screen height in pixels")
@@ -28,7 +36,7 @@ class DeviceInfo(BaseModel):
 class UserPreferences(BaseModel):
     """User preferences for the session."""
     
-    preferred_language: str = Field("en", description="User's preferred language code")
+    preferred_language: LangCode = Field("en", description="User's preferred language code")
     input_type: InputType = Field(InputType.VOICE, description="Preferred input method")
     audio_speed_multiplier: float = Field(1.0, ge=0.5, le=2.0, description="Audio playback speed multiplier")
     text_size_multiplier: float = Field(1.0, ge=0.8, le=2.0, description="Text size multiplier")
@@ -42,9 +50,9 @@ class QueryHistory(BaseModel):
     query_id: str = Field(..., description="Unique identifier for the query")
     user_input: str = Field(..., description="The user's input text")
     input_type: InputType = Field(..., description="Type of input (voice or text)")
-    detected_language: str = Field(..., description="Detected language of the input")
+    detected_language: LangCode = Field(..., description="Detected language of the input")
     response_text: str = Field(..., description="The system's response text")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=request_now)
     processing_time_ms: float = Field(ge=0, description="Time taken to process the query")
 
 
@@ -61,45 +69,61 @@ class ContextualData(BaseModel):
 class ConversationContext(BaseModel):
     """Context for a conversation session."""
     
-    previous_queries: List[QueryHistory] = Field(default_factory=list, description="History of queries in this session")
+    previous_queries: Deque[QueryHistory] = Field(
+        default_factory=lambda: deque(maxlen=MAX_QUERY_HISTORY),
+        description="History of queries in this session",
+    )
     user_preferences: UserPreferences = Field(default_factory=UserPreferences)
     current_topic: Optional[str] = Field(None, description="Current conversation topic")
     contextual_information: ContextualData = Field(default_factory=ContextualData)
     
+    @field_validator("previous_queries")
+    @classmethod
+    def _bound_history(cls, queries: Deque[QueryHistory]) -> Deque[QueryHistory]:
+        """Keep the history bounded so the oldest queries drop off on append."""
+        if queries.maxlen != MAX_QUERY_HISTORY:
+            queries = deque(queries, maxlen=MAX_QUERY_HISTORY)
+        return queries
+    
+    @field_serializer("previous_queries")
+    def _serialize_history(self, queries: Deque[QueryHistory]) -> List[QueryHistory]:
+        """Expose the history as a plain list."""
+        return list(queries)
+    
     def add_query(self, query: QueryHistory) -> None:
         """Add a query to the conversation history."""
+        # The bounded deque evicts the oldest query once the limit is reached
         self.previous_queries.append(query)
-        
-        # Keep only the most recent queries to prevent unbounded growth
-        max_history = 50  # Configurable limit
-        if len(self.previous_queries) > max_history:
-            self.previous_queries = self.previous_queries[-max_history:]
     
     def get_recent_context(self, num_queries: int = 5) -> List[QueryHistory]:
         """Get the most recent queries for context."""
-        return self.previous_queries[-num_queries:] if self.previous_queries else []
+        start = max(0, len(self.previous_queries) - num_queries)
+        return list(islice(self.previous_queries, start, None))
 
 
-class UserSession(TimestampedModel, IdentifiedModel):
+class UserSession(TimestampedModel, IdentifiedModel, FastBaseModel):
     """A user session with conversation context."""
     
     session_id: str = Field(..., description="Unique session identifier")
     device_info: DeviceInfo = Field(..., description="Information about the user's device")
-    language_preference: str = Field("en", description="User's preferred language")
-    last_activity: datetime = Field(default_factory=datetime.utcnow)
+    language_preference: LangCode = Field("en", description="User's preferred language")
+    last_activity: datetime = Field(default_factory=request_now)
     conversation_context: ConversationContext = Field(default_factory=ConversationContext)
     is_active: bool = Field(True, description="Whether the session is currently active")
     
     def update_activity(self) -> None:
         """Update the last activity timestamp."""
-        self.last_activity = datetime.utcnow()
+        self.last_activity = utc_now()
         self.update_timestamp()
     
     def is_expired(self, timeout_minutes: int = 30) -> bool:
         """Check if the session has expired."""
-        from datetime import timedelta
-        timeout_delta = timedelta(minutes=timeout_minutes)
-        return datetime.utcnow() - self.last_activity > timeout_delta
+        last_activity = self.last_activity
+        if last_activity.tzinfo is None:
+            # Naive values (e.g. loaded from the DB) are stored in UTC
+            last_activity = last_activity.replace(tzinfo=timezone.utc)
+        # Compare epoch seconds rather than building a datetime and timedelta per check
+        return time.time() - last_activity.timestamp() > timeout_minutes * 60
     
     def terminate(self) -> None:
         """Terminate the session."""
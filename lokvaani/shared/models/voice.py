@@ -1,11 +1,12 @@
 """Voice processing models for LokVaani."""
 
-from pydantic import Field
+from pydantic import Field, model_validator
 from datetime import datetime
-from typing import Optional, List, Union
+from typing import Any, Optional, List
 from enum import Enum
 
-from .base import BaseModel, TimestampedModel, IdentifiedModel, ProcessingMetrics
+from .base import BaseModel, FastBaseModel, FrozenModel, TimestampedModel, IdentifiedModel, ProcessingMetrics
+from .language import LangCode
 from .session import InputType
 
 
@@ -27,7 +28,7 @@ class AudioQuality(str, Enum):
 class VoiceConfig(BaseModel):
     """Configuration for voice synthesis."""
     
-    language_code: str = Field(..., description="Language code for voice synthesis")
+    language_code: LangCode = Field(..., description="Language code for voice synthesis")
     voice_name: Optional[str] = Field(None, description="Specific voice name to use")
     speaking_rate: float = Field(1.0, ge=0.25, le=4.0, description="Speaking rate multiplier")
     pitch: float = Field(0.0, ge=-20.0, le=20.0, description="Voice pitch adjustment in semitones")
@@ -41,7 +42,7 @@ class SpeechResult(BaseModel):
     
     text: str = Field(..., description="Transcribed text from speech")
     confidence: float = Field(..., ge=0, le=1, description="Confidence score of transcription")
-    detected_language: str = Field(..., description="Detected language code")
+    detected_language: LangCode = Field(..., description="Detected language code")
     alternative_transcriptions: List[str] = Field(default_factory=list, description="Alternative transcription options")
     processing_metrics: ProcessingMetrics = Field(..., description="Processing performance metrics")
 
@@ -57,17 +58,17 @@ class AudioQualityResult(BaseModel):
     recommendations: List[str] = Field(default_factory=list, description="Recommendations for improvement")
 
 
-class VoiceInteraction(TimestampedModel, IdentifiedModel):
+class VoiceInteraction(TimestampedModel, IdentifiedModel, FastBaseModel):
     """A complete voice interaction record."""
     
     interaction_id: str = Field(..., description="Unique interaction identifier")
     session_id: str = Field(..., description="Associated session identifier")
     input_type: InputType = Field(..., description="Type of input (voice or text)")
-    input_data: Union[str, bytes] = Field(..., description="Raw input data (text or audio bytes)")
+    input_data_ref: str = Field(..., description="Blob store key of the raw input data (text or audio bytes)")
     processed_text: str = Field(..., description="Processed text from input")
-    detected_language: str = Field(..., description="Detected input language")
+    detected_language: LangCode = Field(..., description="Detected input language")
     response_text: str = Field(..., description="Generated response text")
-    response_audio: Optional[bytes] = Field(None, description="Generated response audio data")
+    response_audio_ref: Optional[str] = Field(None, description="Blob store key of the generated response audio")
     voice_config: Optional[VoiceConfig] = Field(None, description="Voice configuration used")
     processing_metrics: ProcessingMetrics = Field(..., description="Processing performance metrics")
     
@@ -75,13 +76,27 @@ class VoiceInteraction(TimestampedModel, IdentifiedModel):
     audio_quality: Optional[AudioQualityResult] = Field(None, description="Audio quality assessment")
     speech_result: Optional[SpeechResult] = Field(None, description="Speech recognition result")
     
+    @model_validator(mode="before")
+    @classmethod
+    def _reject_inline_payloads(cls, data: Any) -> Any:
+        """Refuse the pre-blob-store inline fields instead of dropping them."""
+        # extra="ignore" would otherwise discard the audio silently
+        if isinstance(data, dict):
+            for legacy_field in ("input_data", "response_audio"):
+                if legacy_field in data:
+                    raise ValueError(
+                        f"{legacy_field} is no longer stored inline; put the payload in "
+                        f"AudioBlobStore and pass its key as {legacy_field}_ref"
+                    )
+        return data
+    
     def is_voice_input(self) -> bool:
         """Check if this interaction used voice input."""
         return self.input_type == InputType.VOICE
     
     def has_audio_response(self) -> bool:
         """Check if this interaction has an audio response."""
-        return self.response_audio is not None
+        return self.response_audio_ref is not None
 
 
 class AudioControlRequest(BaseModel):
@@ -93,7 +108,7 @@ class AudioControlRequest(BaseModel):
     position_seconds: Optional[float] = Field(None, ge=0, description="Playback position in seconds")
 
 
-class AudioControlResponse(BaseModel):
+class AudioControlResponse(FrozenModel):
     """Response for audio control operations."""
     
     success: bool = Field(..., description="Whether the control operation succeeded")
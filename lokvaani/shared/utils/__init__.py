@@ -1,20 +1,54 @@
 """Shared utilities for LokVaani services."""
 
-from .logging import setup_logging, get_logger
-from .validation import validate_language_code, validate_session_id, validate_audio_format
-from .serialization import serialize_to_redis, deserialize_from_redis
-from .exceptions import LokVaaniException, ValidationError, ProcessingError, ExternalServiceError
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from .exceptions import LokVaaniException, ValidationError, ModelValidationError, ProcessingError, ExternalServiceError
+
+if TYPE_CHECKING:
+    from .logging import setup_logging, get_logger
+    from .validation import validate_language_code, validate_language_codes, validate_session_id, validate_audio_format
+    from .serialization import serialize_to_redis, deserialize_from_redis
+
+# Submodules pulling in structlog, msgspec, etc. load on first attribute access
+_LAZY_IMPORTS = {
+    "setup_logging": ".logging",
+    "get_logger": ".logging",
+    "validate_language_code": ".validation",
+    "validate_language_codes": ".validation",
+    "validate_session_id": ".validation",
+    "validate_audio_format": ".validation",
+    "serialize_to_redis": ".serialization",
+    "deserialize_from_redis": ".serialization",
+}
 
 __all__ = [
     "setup_logging",
     "get_logger",
     "validate_language_code",
+    "validate_language_codes",
     "validate_session_id", 
     "validate_audio_format",
     "serialize_to_redis",
     "deserialize_from_redis",
     "LokVaaniException",
     "ValidationError",
+    "ModelValidationError",
     "ProcessingError",
     "ExternalServiceError",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve lazily imported names (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list:
+    """List lazily imported names alongside loaded ones."""
+    return sorted(set(globals()) | set(__all__))
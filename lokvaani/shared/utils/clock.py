@@ -0,0 +1,43 @@
+"""Request-scoped clock for LokVaani services."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Iterator, Optional
+
+# "Now" shared by everything created while handling one request; unset
+# outside a request_clock() block
+REQUEST_NOW: ContextVar[Optional[datetime]] = ContextVar("request_now", default=None)
+
+
+def request_now() -> datetime:
+    """Get the current request's timestamp, or the current UTC time outside a request."""
+    now = REQUEST_NOW.get()
+    if now is None:
+        return datetime.now(timezone.utc)
+    return now
+
+
+@contextmanager
+def request_clock(now: Optional[datetime] = None) -> Iterator[datetime]:
+    """
+    Pin the request timestamp for the duration of a request.
+    
+    Intended for request middleware, e.g.::
+    
+        with request_clock():
+            response = await call_next(request)
+    
+    Args:
+        now: Timestamp to use; defaults to the current UTC time
+        
+    Yields:
+        The pinned timestamp
+    """
+    if now is None:
+        now = datetime.now(timezone.utc)
+    token = REQUEST_NOW.set(now)
+    try:
+        yield now
+    finally:
+        REQUEST_NOW.reset(token)
@@ -0,0 +1,37 @@
+"""Exception hierarchy for LokVaani services."""
+
+
+class LokVaaniException(Exception):
+    """Base exception for all LokVaani errors."""
+
+
+class ValidationError(LokVaaniException):
+    """Raised when input data fails validation."""
+
+
+class ModelValidationError(ValidationError):
+    """Raised when data fails Pydantic model validation.
+    
+    Keeps the original pydantic error; the message is only formatted from it
+    when the exception is rendered.
+    """
+    
+    def __init__(self, pydantic_error: Exception) -> None:
+        # Passed to Exception so args, repr and pickling carry the error
+        super().__init__(pydantic_error)
+        self.pydantic_error = pydantic_error
+    
+    def __str__(self) -> str:
+        messages = "; ".join(
+            f"{' -> '.join(map(str, error['loc']))}: {error['msg']}"
+            for error in self.pydantic_error.errors()
+        )
+        return f"Validation failed: {messages}"
+
+
+class ProcessingError(LokVaaniException):
+    """Raised when internal processing such as serialization fails."""
+
+
+class ExternalServiceError(LokVaaniException):
+    """Raised when a call to an external service fails."""
@@ -1,39 +1,75 @@
 """Logging configuration for LokVaani services."""
 
+import json
 import logging
+import orjson
 import structlog
 import sys
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Callable, Optional, Tuple
 
-from ..config import settings
+from ..config import get_settings
+
+# Processors shared by every output format, built once at import
+_BASE_PROCESSORS = (
+    structlog.contextvars.merge_contextvars,
+    structlog.stdlib.filter_by_level,
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.PositionalArgumentsFormatter(),
+    structlog.processors.TimeStamper(fmt="iso"),
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+    structlog.processors.UnicodeDecoder(),
+)
+
+
+def _orjson_dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None, **_: Any) -> str:
+    """Serialize a log event with orjson, as JSONRenderer's serializer."""
+    try:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        # e.g. ints wider than 64 bits, which never reach default; a log
+        # call must not raise, so let the stdlib encoder take it
+        return json.dumps(obj, default=default)
+
+
+# (service_name, level, log_format) of the active configuration
+_configured: Optional[Tuple[str, str, str]] = None
 
 
 def setup_logging(service_name: str, log_level: Optional[str] = None) -> None:
-    """Set up structured logging for a service."""
+    """Set up structured logging for a service.
+    
+    Repeated calls with the same service, level and format are no-ops.
+    """
+    global _configured
+    
+    settings = get_settings()
     
     # Use provided log level or fall back to settings
-    level = log_level or settings.log_level
+    level = (log_level or settings.log_level).upper()
+    
+    params = (service_name, level, settings.log_format)
+    if _configured == params:
+        return
     
     # Configure standard library logging
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, level.upper()),
+        level=getattr(logging, level),
+    )
+    
+    renderer = (
+        structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+        if settings.log_format == "json"
+        else structlog.dev.ConsoleRenderer()
     )
     
     # Configure structlog
     structlog.configure(
-        processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer() if settings.log_format == "json" else structlog.dev.ConsoleRenderer(),
-        ],
+        processors=_BASE_PROCESSORS + (renderer,),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         wrapper_class=structlog.stdlib.BoundLogger,
@@ -43,8 +79,11 @@ def setup_logging(service_name: str, log_level: Optional[str] = None) -> None:
     # Add service name to all log entries
     structlog.contextvars.clear_contextvars()
     structlog.contextvars.bind_contextvars(service=service_name)
+    
+    _configured = params
 
 
+@lru_cache(maxsize=256)
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     """Get a structured logger instance."""
     return structlog.get_logger(name)
\ No newline at end of file
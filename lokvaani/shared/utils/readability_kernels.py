@@ -0,0 +1,57 @@
+"""Vectorized readability scoring for LokVaani services.
+
+Scores are computed over whole batches at once from per-text word, sentence
+and syllable counts, e.g. when filling ``SimplificationResult.readability_score``
+for many simplified texts.
+"""
+
+from typing import Any
+
+import numpy as np
+
+
+def _as_counts(counts: Any) -> np.ndarray:
+    """Convert counts to a float64 array, treating zero as one to avoid division by zero."""
+    return np.maximum(np.asarray(counts, dtype=np.float64), 1.0)
+
+
+def flesch_reading_ease(word_counts: Any, sentence_counts: Any, syllable_counts: Any) -> np.ndarray:
+    """
+    Compute Flesch reading ease scores for a batch of texts.
+    
+    Args:
+        word_counts: Number of words in each text
+        sentence_counts: Number of sentences in each text
+        syllable_counts: Number of syllables in each text
+        
+    Returns:
+        Array of scores clipped to 0-100 (higher is easier to read)
+    """
+    words = _as_counts(word_counts)
+    scores = (
+        206.835
+        - 1.015 * (words / _as_counts(sentence_counts))
+        - 84.6 * (np.asarray(syllable_counts, dtype=np.float64) / words)
+    )
+    return np.clip(scores, 0.0, 100.0)
+
+
+def flesch_kincaid_grade(word_counts: Any, sentence_counts: Any, syllable_counts: Any) -> np.ndarray:
+    """
+    Compute Flesch-Kincaid grade levels for a batch of texts.
+    
+    Args:
+        word_counts: Number of words in each text
+        sentence_counts: Number of sentences in each text
+        syllable_counts: Number of syllables in each text
+        
+    Returns:
+        Array of US school grade levels (floored at 0)
+    """
+    words = _as_counts(word_counts)
+    grades = (
+        0.39 * (words / _as_counts(sentence_counts))
+        + 11.8 * (np.asarray(syllable_counts, dtype=np.float64) / words)
+        - 15.59
+    )
+    return np.maximum(grades, 0.0)
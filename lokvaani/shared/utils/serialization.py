@@ -1,45 +1,264 @@
 """Serialization utilities for Redis storage."""
 
 import json
+import math
 import pickle
-from typing import Any, Optional, Dict, Union
+from functools import lru_cache
+from typing import Any, Callable, Optional, Dict, Iterable, List, Sequence, Tuple, Union
 from datetime import datetime, date
 from decimal import Decimal
 
+import ciso8601
+import msgspec
+import orjson
+from pydantic import TypeAdapter
+
 from .exceptions import ProcessingError
 
+# Reused across calls; msgspec encoders are stateless and thread-safe
+_STRUCT_ENCODER = msgspec.json.Encoder()
+_MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+_MSGPACK_DECODER = msgspec.msgpack.Decoder()
+
+# Top-level types JSON can never encode; safe_serialize pickles them directly
+_PICKLE_ONLY_TYPES = frozenset({set, frozenset, bytes, bytearray, complex})
+
+# Protocol 5 (Python 3.8+) frames large bytes/arrays without extra copies and
+# supports out-of-band buffers; older interpreters' defaults are slower
+_PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+# Pickle protocol 2+ opens with PROTO (0x80) and a version byte; the only
+# msgpack payload starting with 0x80 is the one-byte empty map. Multi-byte
+# payloads below it are JSON, as msgpack only uses that range for fixints;
+# a single byte there is tried as JSON first
+_PICKLE_PROTO = 0x80
+
+# Datetimes are passed through to _orjson_default so they keep the tagged
+# form that datetime_decoder (and data already cached in Redis) expects.
+# Dataclasses are passed through so the default rejects them, as json.dumps did
+_ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+)
+
+# Untagged mode: orjson writes datetimes as bare ISO strings itself
+_BARE_ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+
+# Key types json.dumps accepts; orjson's OPT_NON_STR_KEYS takes more
+_JSON_KEY_TYPES = (str, int, float, bool, type(None))
+
+# orjson's message for ints it cannot encode; json.dumps handles them
+_ORJSON_INT_RANGE_ERROR = "Integer exceeds 64-bit range"
+
+# Every tag key starts with this, so untagged payloads skip the rehydrate pass
+_TAG_MARKER = '"__d'
+
+
+# Tagged encodings keyed by exact type; datetime precedes date so the
+# isinstance fallback for subclasses also picks the most specific tag
+_TAG_ENCODERS: Dict[type, Callable[[Any], Dict[str, str]]] = {
+    datetime: lambda obj: {"__datetime__": obj.isoformat()},
+    date: lambda obj: {"__date__": obj.isoformat()},
+    Decimal: lambda obj: {"__decimal__": str(obj)},
+}
+
+# Constructors keyed by tag; bound once since datetime_decoder runs per object
+_TAG_DECODERS: Dict[str, Callable[[str], Any]] = {
+    "__datetime__": ciso8601.parse_datetime,
+    "__date__": date.fromisoformat,
+    "__decimal__": Decimal,
+}
+
+
+def _tag_subclass_value(obj: Any) -> Optional[Dict[str, str]]:
+    """Get the tagged encoding of a subclass instance (e.g. pandas.Timestamp), or None."""
+    for tagged_type, encoder in _TAG_ENCODERS.items():
+        if isinstance(obj, tagged_type):
+            return encoder(obj)
+    return None
+
+
+def _tag_value(obj: Any, _encoders=_TAG_ENCODERS) -> Optional[Dict[str, str]]:
+    """Get the tagged encoding of obj, or None if it has none."""
+    encoder = _encoders.get(type(obj))
+    if encoder is not None:
+        return encoder(obj)
+    return _tag_subclass_value(obj)
+
 
 class DateTimeEncoder(json.JSONEncoder):
     """JSON encoder that handles datetime objects."""
     
     def default(self, obj):
-        if isinstance(obj, datetime):
-            return {"__datetime__": obj.isoformat()}
-        elif isinstance(obj, date):
-            return {"__date__": obj.isoformat()}
-        elif isinstance(obj, Decimal):
-            return {"__decimal__": str(obj)}
+        tagged = _tag_value(obj)
+        if tagged is not None:
+            return tagged
         return super().default(obj)
 
 
-def datetime_decoder(dct: Dict[str, Any]) -> Dict[str, Any]:
+def datetime_decoder(dct: Dict[str, Any], _decoders=_TAG_DECODERS) -> Dict[str, Any]:
     """JSON decoder that handles datetime objects."""
-    if "__datetime__" in dct:
-        return datetime.fromisoformat(dct["__datetime__"])
-    elif "__date__" in dct:
-        return date.fromisoformat(dct["__date__"])
-    elif "__decimal__" in dct:
-        return Decimal(dct["__decimal__"])
+    # Tagged objects always have exactly one key, so one lookup identifies them
+    if len(dct) == 1:
+        for key, value in dct.items():
+            decoder = _decoders.get(key)
+            if decoder is not None:
+                return decoder(value)
     return dct
 
 
-def serialize_to_redis(data: Any, use_pickle: bool = False) -> Union[str, bytes]:
+def _check_json_compatible(data: Any) -> None:
+    """
+    Reject what json.dumps rejected but orjson would silently encode.
+    
+    orjson writes UUIDs, plain Enums and numpy arrays as strings/values and
+    non-finite floats as null, with no option to refuse them. Raising here
+    keeps them out of JSON, so ``safe_serialize`` pickles them instead.
+    
+    Raises:
+        TypeError: For values or keys json.dumps cannot encode
+        ValueError: For NaN and infinite floats
+    """
+    stack = [data]
+    pop = stack.pop
+    while stack:
+        value = pop()
+        value_type = type(value)
+        if value_type is str or value_type is int or value_type is bool or value is None:
+            continue
+        if value_type is dict or isinstance(value, dict):
+            for key in value:
+                if not isinstance(key, _JSON_KEY_TYPES):
+                    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+            stack.extend(value.values())
+        elif value_type is list or isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, float):
+            if not math.isfinite(value):
+                raise ValueError(f"Out of range float values are not JSON compliant: {value!r}")
+        elif not isinstance(value, (str, int, datetime, date, Decimal)):
+            # str/int subclasses (e.g. str-Enums) are fine, as with json.dumps
+            raise TypeError(f"Object of type {value_type.__name__} is not JSON serializable")
+
+
+def _encode_json_subclass(obj: Any) -> Any:
+    """Encode float and tuple subclasses orjson skips, as json.dumps did, or None."""
+    if isinstance(obj, float):
+        return float(obj)
+    if isinstance(obj, tuple):
+        return list(obj)
+    return None
+
+
+def _orjson_default(obj: Any, _encoders=_TAG_ENCODERS) -> Any:
+    """Encode the types orjson leaves to us, in DateTimeEncoder's tagged form."""
+    encoder = _encoders.get(type(obj))
+    if encoder is not None:
+        return encoder(obj)
+    tagged = _tag_subclass_value(obj)
+    if tagged is None:
+        tagged = _encode_json_subclass(obj)
+    if tagged is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return tagged
+
+
+def _orjson_default_bare(obj: Any) -> Any:
+    """Encode the types orjson leaves to us as bare strings, without tags."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    # Covers datetime too; only subclasses orjson does not recognise get here
+    if isinstance(obj, date):
+        return obj.isoformat()
+    encoded = _encode_json_subclass(obj)
+    if encoded is not None:
+        return encoded
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _rehydrate(value: Any) -> Any:
+    """Apply datetime_decoder bottom-up, as json.loads' object_hook would."""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(item, (dict, list)):
+                value[key] = _rehydrate(item)
+        return datetime_decoder(value)
+    if isinstance(value, list):
+        for index, item in enumerate(value):
+            if isinstance(item, (dict, list)):
+                value[index] = _rehydrate(item)
+    return value
+
+
+@lru_cache(maxsize=None)
+def _struct_decoder(struct_type: Any) -> msgspec.json.Decoder:
+    """Get a cached typed JSON decoder for a msgspec type."""
+    return msgspec.json.Decoder(struct_type)
+
+
+@lru_cache(maxsize=None)
+def _struct_msgpack_decoder(struct_type: Any) -> msgspec.msgpack.Decoder:
+    """Get a cached typed MessagePack decoder for a msgspec type."""
+    return msgspec.msgpack.Decoder(struct_type)
+
+
+@lru_cache(maxsize=None)
+def _type_adapter(model_class: Any) -> TypeAdapter:
+    """Get a cached TypeAdapter, so its validator is built once per type."""
+    return TypeAdapter(model_class)
+
+
+def _is_struct_payload(data: Any) -> bool:
+    """Check whether data is a msgspec Struct or a sequence of them."""
+    if isinstance(data, msgspec.Struct):
+        return True
+    return isinstance(data, (list, tuple)) and bool(data) and isinstance(data[0], msgspec.Struct)
+
+
+def _encode_json(data: Any, tag_types: bool = True) -> Union[str, bytes]:
+    """Encode data as JSON, letting encoder errors propagate unwrapped."""
+    if _is_struct_payload(data):
+        return _STRUCT_ENCODER.encode(data)
+    _check_json_compatible(data)
+    try:
+        if not tag_types:
+            return orjson.dumps(data, default=_orjson_default_bare, option=_BARE_ORJSON_OPTIONS).decode()
+        return orjson.dumps(data, default=_orjson_default, option=_ORJSON_OPTIONS).decode()
+    except TypeError as e:
+        if _ORJSON_INT_RANGE_ERROR not in str(e):
+            raise
+    # Ints wider than 64 bits: fall back to the stdlib encoder
+    if not tag_types:
+        return json.dumps(data, default=_orjson_default_bare)
+    return json.dumps(data, cls=DateTimeEncoder)
+
+
+def serialize_to_redis(
+    data: Any,
+    use_pickle: bool = False,
+    use_msgpack: bool = False,
+    tag_types: bool = True,
+) -> Union[str, bytes]:
     """
     Serialize data for Redis storage.
     
+    msgspec Structs (see ``lokvaani.shared.models._fast``), or lists of them,
+    are encoded by msgspec as UTF-8 JSON bytes.
+    
+    JSON mode refuses what ``json.dumps`` refused (UUIDs, dataclasses,
+    plain Enums, numpy arrays) and, rather than writing them as ``null``,
+    NaN and infinite floats; ``safe_serialize`` pickles such data. Payloads
+    written by ``json.dumps`` with ``NaN`` tokens are still read.
+    
     Args:
         data: The data to serialize
         use_pickle: Whether to use pickle instead of JSON
+        use_msgpack: Whether to use MessagePack instead of JSON. Smaller and
+            faster, but bytes must go through a binary-safe client
+            (``get_redis_binary_client``)
+        tag_types: Wrap datetimes, dates and Decimals in ``{"__datetime__": ...}``
+            style tags so untyped reads restore them. When False they are
+            written as bare strings, roughly halving timestamp-heavy
+            payloads; read those back with a typed ``struct_type``
         
     Returns:
         Serialized data as string or bytes
@@ -49,20 +268,76 @@ def serialize_to_redis(data: Any, use_pickle: bool = False) -> Union[str, bytes]
     """
     try:
         if use_pickle:
-            return pickle.dumps(data)
+            return pickle.dumps(data, protocol=_PICKLE_PROTOCOL)
+        elif use_msgpack:
+            return _MSGPACK_ENCODER.encode(data)
+        else:
+            return _encode_json(data, tag_types)
+    except Exception as e:
+        raise ProcessingError(f"Failed to serialize data: {e}")
+
+
+def serialize_many_to_redis(
+    items: Iterable[Any],
+    use_pickle: bool = False,
+    use_msgpack: bool = False,
+    tag_types: bool = True,
+) -> List[Union[str, bytes]]:
+    """
+    Serialize a batch of values for Redis storage in one call.
+    
+    Takes the same options as ``serialize_to_redis``, resolving them once for
+    the whole batch. Pair it with a pipeline so the writes also go out in one
+    round trip::
+    
+        values = serialize_many_to_redis(items, use_msgpack=True)
+        pipe = client.pipeline(transaction=False)
+        pipe.mset(dict(zip(keys, values)))
+        pipe.execute()
+    
+    Args:
+        items: The values to serialize
+        use_pickle: Whether to use pickle instead of JSON
+        use_msgpack: Whether to use MessagePack instead of JSON
+        tag_types: Whether to tag datetimes, dates and Decimals (JSON only)
+        
+    Returns:
+        Serialized values, in input order
+        
+    Raises:
+        ProcessingError: If serializing any value fails
+    """
+    try:
+        if use_pickle:
+            return [pickle.dumps(item, protocol=_PICKLE_PROTOCOL) for item in items]
+        elif use_msgpack:
+            encode = _MSGPACK_ENCODER.encode
+            return [encode(item) for item in items]
         else:
-            return json.dumps(data, cls=DateTimeEncoder, ensure_ascii=False)
+            return [_encode_json(item, tag_types) for item in items]
     except Exception as e:
         raise ProcessingError(f"Failed to serialize data: {e}")
 
 
-def deserialize_from_redis(data: Union[str, bytes], use_pickle: bool = False) -> Any:
+def deserialize_from_redis(
+    data: Union[str, bytes],
+    use_pickle: bool = False,
+    struct_type: Optional[Any] = None,
+    use_msgpack: bool = False,
+) -> Any:
     """
     Deserialize data from Redis storage.
     
+    Untyped MessagePack decoding restores timezone-aware datetimes natively;
+    naive datetimes, dates and Decimals come back as strings unless a
+    ``struct_type`` describing them is given.
+    
     Args:
         data: The serialized data
         use_pickle: Whether the data was pickled
+        struct_type: msgspec type to decode and validate into, e.g.
+            ``QueryHistoryStruct`` or ``List[QueryHistoryStruct]``
+        use_msgpack: Whether the data was encoded as MessagePack
         
     Returns:
         Deserialized data
@@ -73,18 +348,86 @@ def deserialize_from_redis(data: Union[str, bytes], use_pickle: bool = False) ->
     try:
         if use_pickle:
             return pickle.loads(data)
+        elif use_msgpack:
+            if struct_type is not None:
+                return _struct_msgpack_decoder(struct_type).decode(data)
+            return _MSGPACK_DECODER.decode(data)
+        elif struct_type is not None:
+            return _struct_decoder(struct_type).decode(data)
         else:
-            return json.loads(data, object_hook=datetime_decoder)
+            try:
+                result = orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # Payloads from the json.dumps era may hold NaN/Infinity,
+                # which orjson rejects
+                return json.loads(data, object_hook=datetime_decoder)
+            marker_present = (
+                _TAG_MARKER in data if isinstance(data, str) else _TAG_MARKER.encode() in data
+            )
+            return _rehydrate(result) if marker_present else result
+    except Exception as e:
+        raise ProcessingError(f"Failed to deserialize data: {e}")
+
+
+def serialize_pickle_out_of_band(data: Any) -> Tuple[bytes, List[memoryview]]:
+    """
+    Pickle data with protocol 5, keeping large buffers out of the pickle stream.
+    
+    numpy arrays, ``pickle.PickleBuffer``-wrapped audio and other objects that
+    support out-of-band pickling are returned as raw views instead of being
+    copied into the main payload. Store each view under its own key (e.g. via
+    ``AudioBlobStore``) or pipeline them alongside the main bytes.
+    
+    Args:
+        data: The data to serialize
+        
+    Returns:
+        Tuple of the main pickle bytes and the out-of-band buffers, in order
+        
+    Raises:
+        ProcessingError: If serialization fails
+    """
+    buffers: List[pickle.PickleBuffer] = []
+    try:
+        main = pickle.dumps(data, protocol=5, buffer_callback=buffers.append)
+        return main, [buffer.raw() for buffer in buffers]
+    except Exception as e:
+        raise ProcessingError(f"Failed to serialize data: {e}")
+
+
+def deserialize_pickle_out_of_band(data: bytes, buffers: Sequence[Any]) -> Any:
+    """
+    Unpickle data written by ``serialize_pickle_out_of_band``.
+    
+    Args:
+        data: The main pickle bytes
+        buffers: The out-of-band buffers, in the order they were returned
+        
+    Returns:
+        Deserialized data
+        
+    Raises:
+        ProcessingError: If deserialization fails
+    """
+    try:
+        return pickle.loads(data, buffers=buffers)
     except Exception as e:
         raise ProcessingError(f"Failed to deserialize data: {e}")
 
 
-def serialize_pydantic_model(model: Any) -> str:
+def serialize_pydantic_model(model: Any, exclude_none: bool = False) -> str:
     """
     Serialize a Pydantic model to JSON string.
     
+    Calls the model's compiled pydantic-core serializer directly. For models
+    written on every request, a msgspec mirror (see
+    ``lokvaani.shared.models._fast``) encodes several times faster still.
+    
     Args:
         model: The Pydantic model instance
+        exclude_none: Omit fields whose value is None. Shrinks payloads with
+            many unset optional fields (e.g. ``ContentResponse``); only use
+            it for models whose nullable fields all default to None
         
     Returns:
         JSON string representation
@@ -93,7 +436,7 @@ def serialize_pydantic_model(model: Any) -> str:
         ProcessingError: If serialization fails
     """
     try:
-        return model.model_dump_json()
+        return model.__pydantic_serializer__.to_json(model, exclude_none=exclude_none).decode()
     except Exception as e:
         raise ProcessingError(f"Failed to serialize Pydantic model: {e}")
 
@@ -103,7 +446,8 @@ def deserialize_pydantic_model(model_class: type, data: str) -> Any:
     Deserialize JSON string to Pydantic model.
     
     Args:
-        model_class: The Pydantic model class
+        model_class: The Pydantic model class, or any type pydantic can
+            validate (e.g. ``List[QueryHistory]``)
         data: JSON string data
         
     Returns:
@@ -113,18 +457,21 @@ def deserialize_pydantic_model(model_class: type, data: str) -> Any:
         ProcessingError: If deserialization fails
     """
     try:
-        return model_class.model_validate_json(data)
+        return _type_adapter(model_class).validate_json(data)
     except Exception as e:
         raise ProcessingError(f"Failed to deserialize Pydantic model: {e}")
 
 
-def safe_serialize(data: Any, fallback_to_pickle: bool = True) -> Union[str, bytes]:
+def safe_serialize(data: Any, fallback_to_pickle: bool = True, use_msgpack: bool = False) -> Union[str, bytes]:
     """
     Safely serialize data, falling back to pickle if JSON fails.
     
     Args:
         data: The data to serialize
         fallback_to_pickle: Whether to fallback to pickle if JSON fails
+        use_msgpack: Try MessagePack before JSON. Only for data whose types
+            MessagePack round-trips: sets, dates, naive datetimes and
+            Decimals are encoded without error but decode as lists/strings
         
     Returns:
         Serialized data
@@ -132,23 +479,31 @@ def safe_serialize(data: Any, fallback_to_pickle: bool = True) -> Union[str, byt
     Raises:
         ProcessingError: If all serialization methods fail
     """
-    try:
-        # Try JSON first
-        return serialize_to_redis(data, use_pickle=False)
-    except ProcessingError:
-        if fallback_to_pickle:
+    # Encoders are called directly so a failed attempt costs only the
+    # encoder's own exception, not a wrapped ProcessingError per fallback
+    if not (fallback_to_pickle and type(data) in _PICKLE_ONLY_TYPES):
+        if use_msgpack:
             try:
-                # Fallback to pickle
-                return serialize_to_redis(data, use_pickle=True)
-            except ProcessingError as e:
-                raise ProcessingError(f"Failed to serialize with both JSON and pickle: {e}")
-        else:
-            raise
+                return _MSGPACK_ENCODER.encode(data)
+            except Exception:
+                pass
+        
+        try:
+            return _encode_json(data)
+        except Exception as e:
+            if not fallback_to_pickle:
+                raise ProcessingError(f"Failed to serialize data: {e}")
+    
+    try:
+        # Fallback to pickle
+        return pickle.dumps(data, protocol=_PICKLE_PROTOCOL)
+    except Exception as e:
+        raise ProcessingError(f"Failed to serialize with MessagePack, JSON and pickle: {e}")
 
 
 def safe_deserialize(data: Union[str, bytes], expected_type: Optional[type] = None) -> Any:
     """
-    Safely deserialize data, trying both JSON and pickle.
+    Safely deserialize data written by ``safe_serialize`` or older JSON/pickle writers.
     
     Args:
         data: The serialized data
@@ -160,16 +515,26 @@ def safe_deserialize(data: Union[str, bytes], expected_type: Optional[type] = No
     Raises:
         ProcessingError: If deserialization fails
     """
-    # Try to determine if data is pickled (bytes) or JSON (string)
+    # Bytes may be pickle, MessagePack or JSON; strings are always JSON
     if isinstance(data, bytes):
         try:
-            result = deserialize_from_redis(data, use_pickle=True)
-        except ProcessingError:
-            # Maybe it's JSON encoded as bytes
-            try:
-                result = deserialize_from_redis(data.decode('utf-8'), use_pickle=False)
-            except ProcessingError as e:
-                raise ProcessingError(f"Failed to deserialize bytes data: {e}")
+            # The first byte picks the decoder: JSON text is ASCII, while a
+            # MessagePack value starting below 0x80 is a one-byte fixint
+            if len(data) > 1 and data[0] == _PICKLE_PROTO:
+                result = deserialize_from_redis(data, use_pickle=True)
+            elif data and data[0] < _PICKLE_PROTO:
+                try:
+                    result = deserialize_from_redis(data, use_pickle=False)
+                except ProcessingError:
+                    # A lone byte that is not JSON (e.g. b'{') is a fixint;
+                    # one that is (b'5') stays JSON, as safe_serialize wrote it
+                    if len(data) > 1:
+                        raise
+                    result = deserialize_from_redis(data, use_msgpack=True)
+            else:
+                result = deserialize_from_redis(data, use_msgpack=True)
+        except ProcessingError as e:
+            raise ProcessingError(f"Failed to deserialize bytes data: {e}")
     else:
         try:
             result = deserialize_from_redis(data, use_pickle=False)
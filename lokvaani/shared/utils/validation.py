@@ -1,21 +1,30 @@
 """Validation utilities for LokVaani services."""
 
 import re
+import string
+import sys
 from typing import List, Optional
 from pydantic import ValidationError as PydanticValidationError
 
-from .exceptions import ValidationError
+from .exceptions import ModelValidationError, ValidationError
 
 
 # Language code patterns
 LANGUAGE_CODE_PATTERN = re.compile(r'^[a-z]{2}(-[A-Z]{2})?$')
 SESSION_ID_PATTERN = re.compile(r'^[a-zA-Z0-9\-_]{8,64}$')
 
+# SESSION_ID_PATTERN as a byte-deletion set: an ID is valid when deleting
+# these bytes leaves nothing, which bytes.translate scans in C
+_SESSION_ID_CHARS = (string.ascii_letters + string.digits + '-_').encode('ascii')
+_SESSION_ID_MIN_LENGTH = 8
+_SESSION_ID_MAX_LENGTH = 64
+
 # Supported audio formats
 SUPPORTED_AUDIO_FORMATS = {'wav', 'mp3', 'flac', 'ogg', 'webm', 'm4a'}
 
-# Supported language codes (ISO 639-1 with optional country codes)
-SUPPORTED_LANGUAGES = {
+# Supported language codes (ISO 639-1 with optional country codes); interned
+# so the canonical codes returned below are the same objects models intern
+SUPPORTED_LANGUAGES = frozenset(map(sys.intern, {
     'en', 'en-US', 'en-GB', 'en-AU', 'en-CA',
     'hi', 'hi-IN',
     'es', 'es-ES', 'es-MX', 'es-AR',
@@ -39,7 +48,16 @@ SUPPORTED_LANGUAGES = {
     'mr', 'mr-IN',
     'or', 'or-IN',
     'as', 'as-IN',
-}
+}))
+
+# Case-insensitive lookup to the canonical spelling, e.g. 'en-us' -> 'en-US'.
+# Canonical spellings map to themselves so clean input skips strip/lower
+_CANONICAL_LANGUAGE_CODES = {code.lower(): code for code in SUPPORTED_LANGUAGES}
+_CANONICAL_LANGUAGE_CODES.update((code, code) for code in SUPPORTED_LANGUAGES)
+
+# Sorted once; the supported sets never change at runtime
+_SUPPORTED_LANGUAGES_SORTED = tuple(sorted(SUPPORTED_LANGUAGES))
+_SUPPORTED_AUDIO_FORMATS_SORTED = tuple(sorted(SUPPORTED_AUDIO_FORMATS))
 
 
 def validate_language_code(language_code: str, strict: bool = True) -> str:
@@ -51,7 +69,7 @@ def validate_language_code(language_code: str, strict: bool = True) -> str:
         strict: If True, only allow supported languages
         
     Returns:
-        The validated language code
+        The validated language code, canonically cased (e.g. 'en-US')
         
     Raises:
         ValidationError: If the language code is invalid
@@ -59,19 +77,69 @@ def validate_language_code(language_code: str, strict: bool = True) -> str:
     if not language_code:
         raise ValidationError("Language code cannot be empty")
     
-    language_code = language_code.strip().lower()
+    # Already-canonical codes, the bulk of trusted upstream traffic
+    canonical = _CANONICAL_LANGUAGE_CODES.get(language_code)
+    if canonical is not None:
+        return canonical
+    
+    language_code = language_code.strip()
+    
+    # Every supported code is well formed, so one lookup covers both checks;
+    # the regex only runs for codes outside the supported set
+    canonical = _CANONICAL_LANGUAGE_CODES.get(language_code.lower())
+    if canonical is not None:
+        return canonical
+    
+    if strict:
+        if not LANGUAGE_CODE_PATTERN.match(_normalize_case(language_code)):
+            raise ValidationError(f"Invalid language code format: {language_code.lower()}")
+        raise ValidationError(f"Unsupported language code: {language_code.lower()}")
+    
+    language_code = _normalize_case(language_code)
     
     # Check format
     if not LANGUAGE_CODE_PATTERN.match(language_code):
         raise ValidationError(f"Invalid language code format: {language_code}")
     
-    # Check if supported (if strict mode)
-    if strict and language_code not in SUPPORTED_LANGUAGES:
-        raise ValidationError(f"Unsupported language code: {language_code}")
-    
     return language_code
 
 
+def validate_language_codes(language_codes: List[str], strict: bool = True) -> List[str]:
+    """
+    Validate a batch of language codes.
+    
+    Args:
+        language_codes: The language codes to validate
+        strict: If True, only allow supported languages
+        
+    Returns:
+        The validated language codes, canonically cased, in input order
+        
+    Raises:
+        ValidationError: If any language code is invalid
+    """
+    if not all(isinstance(code, str) and code for code in language_codes):
+        raise ValidationError("Language code cannot be empty")
+    
+    if not strict:
+        return [validate_language_code(code, strict=False) for code in language_codes]
+    
+    lowered = [code.strip().lower() for code in language_codes]
+    # One set difference finds every unsupported code without per-item calls
+    unsupported = set(lowered).difference(_CANONICAL_LANGUAGE_CODES)
+    if unsupported:
+        # repr keeps blank entries (e.g. '  ' stripped to '') visible
+        raise ValidationError(f"Unsupported language codes: {', '.join(map(repr, sorted(unsupported)))}")
+    
+    return [_CANONICAL_LANGUAGE_CODES[code] for code in lowered]
+
+
+def _normalize_case(language_code: str) -> str:
+    """Lowercase the language part and uppercase the region part of a code."""
+    language, separator, region = language_code.partition('-')
+    return language.lower() + separator + region.upper()
+
+
 def validate_session_id(session_id: str) -> str:
     """
     Validate a session ID.
@@ -90,7 +158,11 @@ def validate_session_id(session_id: str) -> str:
     
     session_id = session_id.strip()
     
-    if not SESSION_ID_PATTERN.match(session_id):
+    if (
+        not _SESSION_ID_MIN_LENGTH <= len(session_id) <= _SESSION_ID_MAX_LENGTH
+        or not session_id.isascii()
+        or session_id.encode('ascii').translate(None, _SESSION_ID_CHARS)
+    ):
         raise ValidationError(f"Invalid session ID format: {session_id}")
     
     return session_id
@@ -112,6 +184,10 @@ def validate_audio_format(audio_format: str) -> str:
     if not audio_format:
         raise ValidationError("Audio format cannot be empty")
     
+    # Clean input needs no strip/lower copies
+    if audio_format in SUPPORTED_AUDIO_FORMATS:
+        return audio_format
+    
     audio_format = audio_format.strip().lower()
     
     if audio_format not in SUPPORTED_AUDIO_FORMATS:
@@ -162,7 +238,9 @@ def validate_confidence_score(score: float) -> float:
     Raises:
         ValidationError: If the confidence score is invalid
     """
-    if not isinstance(score, (int, float)):
+    # Exact type check: rejects bool, which isinstance would accept as int
+    score_type = type(score)
+    if score_type is not float and score_type is not int:
         raise ValidationError("Confidence score must be a number")
     
     if not 0.0 <= score <= 1.0:
@@ -184,7 +262,8 @@ def validate_audio_speed_multiplier(multiplier: float) -> float:
     Raises:
         ValidationError: If the speed multiplier is invalid
     """
-    if not isinstance(multiplier, (int, float)):
+    multiplier_type = type(multiplier)
+    if multiplier_type is not float and multiplier_type is not int:
         raise ValidationError("Speed multiplier must be a number")
     
     if not 0.25 <= multiplier <= 4.0:
@@ -205,25 +284,19 @@ def validate_pydantic_model(model_class, data: dict) -> object:
         The validated model instance
         
     Raises:
-        ValidationError: If validation fails
+        ModelValidationError: If validation fails
     """
     try:
         return model_class(**data)
     except PydanticValidationError as e:
-        error_messages = []
-        for error in e.errors():
-            field = " -> ".join(str(loc) for loc in error['loc'])
-            message = error['msg']
-            error_messages.append(f"{field}: {message}")
-        
-        raise ValidationError(f"Validation failed: {'; '.join(error_messages)}")
+        raise ModelValidationError(e)
 
 
 def get_supported_languages() -> List[str]:
     """Get list of supported language codes."""
-    return sorted(list(SUPPORTED_LANGUAGES))
+    return list(_SUPPORTED_LANGUAGES_SORTED)
 
 
 def get_supported_audio_formats() -> List[str]:
     """Get list of supported audio formats."""
-    return sorted(list(SUPPORTED_AUDIO_FORMATS))
\ No newline at end of file
+    return list(_SUPPORTED_AUDIO_FORMATS_SORTED)
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""Tests for accessibility models."""
+
+import pytest
+
+from lokvaani.shared.models.accessibility import (
+    AccessibilityConfig,
+    AccessibilityFeature,
+    AccessibilityReport,
+)
+
+
+def _feature(feature_id, category):
+    return AccessibilityFeature(
+        feature_id=feature_id,
+        name=feature_id,
+        description=feature_id,
+        category=category,
+    )
+
+
+def _report(features):
+    return AccessibilityReport(
+        overall_score=80,
+        wcag_compliance_level="AA",
+        supported_features=features,
+        level_a_compliance=True,
+        level_aa_compliance=True,
+        level_aaa_compliance=False,
+    )
+
+
+def test_report_indexes_track_reassigned_features():
+    report = _report([_feature("captions", "audio")])
+    assert report.is_feature_supported("captions")
+    
+    report.supported_features = report.supported_features + (_feature("zoom", "visual"),)
+    assert report.is_feature_supported("zoom")
+    assert [f.feature_id for f in report.get_features_by_category("visual")] == ["zoom"]
+
+
+def test_report_copy_with_update_reindexes_features():
+    report = _report([_feature("captions", "audio")])
+    assert report.is_feature_supported("captions")
+    
+    copied = report.model_copy(update={"supported_features": ()})
+    assert not copied.is_feature_supported("captions")
+    assert copied.get_features_by_category("audio") == []
+    assert report.is_feature_supported("captions")
+
+
+def test_report_features_cannot_be_mutated_in_place():
+    report = _report([_feature("captions", "audio")])
+    with pytest.raises(AttributeError):
+        report.supported_features.append(_feature("zoom", "visual"))
+
+
+@pytest.mark.parametrize("multiplier, base_size, expected", [
+    (1.0, 16, 16),
+    (1.13, 16, 18),
+    (1.15, 14, 16),
+    (1.15, 16, 18),
+    (1.5, 16, 24),
+    (2.999, 16, 47),
+    (3.0, 16, 48),
+])
+def test_text_size_pixels_truncates(multiplier, base_size, expected):
+    config = AccessibilityConfig(text_size_multiplier=multiplier)
+    assert config.get_text_size_pixels(base_size) == expected
+
+
+def test_text_size_pixels_matches_float_formula_across_range():
+    for centi in range(80, 301):
+        multiplier = centi / 100
+        config = AccessibilityConfig(text_size_multiplier=multiplier)
+        for base_size in (12, 14, 16, 18, 20, 24):
+            assert config.get_text_size_pixels(base_size) == int(base_size * multiplier)
@@ -0,0 +1,59 @@
+"""Tests for database and Redis connection management."""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import redis
+from sqlalchemy.pool import StaticPool
+
+from lokvaani.shared.config import get_settings
+from lokvaani.shared.database import connection
+
+
+def test_redis_client_uses_bounded_blocking_pool(monkeypatch):
+    monkeypatch.setattr(redis.Redis, "ping", lambda self: True)
+    settings = get_settings()
+    
+    client = connection._create_redis_client(test=True, decode_responses=True)
+    pool = client.connection_pool
+    
+    assert isinstance(pool, redis.BlockingConnectionPool)
+    assert pool.max_connections == settings.redis_max_connections
+    assert pool.timeout == settings.redis_pool_timeout
+
+
+class _RecordingPool:
+    """Pool stand-in recording which thread connects and what is released."""
+    
+    def __init__(self):
+        self.threads = set()
+        self.released = []
+    
+    def get_connection(self, command_name, *keys, **options):
+        self.threads.add(threading.get_ident())
+        return object()
+    
+    def release(self, connection):
+        self.released.append(connection)
+
+
+def test_redis_warm_up_runs_off_the_event_loop_and_releases(monkeypatch):
+    pool = _RecordingPool()
+    
+    class _Client:
+        connection_pool = pool
+    
+    monkeypatch.setattr(connection, "get_redis_client", lambda test=False: _Client())
+    # A StaticPool engine skips the database half of the warm-up
+    engine = SimpleNamespace(pool=StaticPool(lambda: None))
+    monkeypatch.setattr(connection, "get_database_engine", lambda test=False: engine)
+    
+    async def warm():
+        await connection.warm_up_connections(test=True)
+        return threading.get_ident()
+    
+    loop_thread = asyncio.run(warm())
+    expected = get_settings().redis_max_connections // 2
+    assert len(pool.released) == expected
+    assert pool.threads and loop_thread not in pool.threads
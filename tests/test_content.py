@@ -0,0 +1,33 @@
+"""Tests for content processing models."""
+
+from lokvaani.shared.models.base import ProcessingMetrics
+from lokvaani.shared.models.content import SimplificationResult, TermExplanation
+
+
+def _result(terms):
+    return SimplificationResult(
+        simplified_text="text",
+        complexity_reduction=0.5,
+        preserved_key_points=[],
+        technical_terms_explained=terms,
+        processing_metrics=ProcessingMetrics(processing_time_ms=1.0),
+    )
+
+
+def test_get_explanation_for_term_is_case_insensitive():
+    api = TermExplanation(term="API", definition="interface")
+    result = _result((api,))
+    assert result.get_explanation_for_term("api") is api
+    assert result.get_explanation_for_term("sdk") is None
+
+
+def test_copy_with_update_reindexes_terms():
+    api = TermExplanation(term="API", definition="interface")
+    sdk = TermExplanation(term="SDK", definition="kit")
+    result = _result((api,))
+    assert result.get_explanation_for_term("api") is api
+    
+    copied = result.model_copy(update={"technical_terms_explained": (sdk,)})
+    assert copied.get_explanation_for_term("api") is None
+    assert copied.get_explanation_for_term("sdk") is sdk
+    assert result.get_explanation_for_term("api") is api
@@ -0,0 +1,125 @@
+"""Tests for language models."""
+
+import pytest
+
+from lokvaani.shared.models.base import ProcessingMetrics
+from lokvaani.shared.models.language import (
+    LanguageCandidate,
+    LanguageConfig,
+    LanguageDetectionBatchResult,
+    LanguageDetectionResult,
+    MultilingualText,
+    VoiceOption,
+)
+
+
+def test_get_text_prefers_primary_added_by_direct_mutation():
+    text = MultilingualText(texts={"hi": "namaste"}, primary_language="en")
+    text.texts["en"] = "hello"
+    assert text.get_text("fr") == "hello"
+
+
+def test_get_text_falls_back_to_first_available():
+    text = MultilingualText(texts={"hi": "namaste", "ta": "vanakkam"}, primary_language="en")
+    assert text.get_text("fr") == "namaste"
+    del text.texts["hi"]
+    assert text.get_text("fr") == "vanakkam"
+    assert text.get_text("fr", fallback=False) is None
+
+
+def test_get_text_fallback_follows_current_dict_order():
+    text = MultilingualText(texts={"hi": "namaste", "ta": "vanakkam"}, primary_language="en")
+    assert text.get_text("fr") == "namaste"
+    
+    # Removing and re-adding moves "hi" behind "ta"
+    text.texts["hi"] = text.texts.pop("hi")
+    assert text.get_text("fr") == "vanakkam"
+    
+    text.texts = {"bn": "nomoshkar", "hi": "namaste"}
+    assert text.get_text("fr") == "nomoshkar"
+
+
+def test_add_translation_of_primary_becomes_fallback():
+    text = MultilingualText(texts={"hi": "namaste"}, primary_language="en")
+    assert text.get_text("fr") == "namaste"
+    text.add_translation("en", "hello")
+    assert text.get_text("fr") == "hello"
+
+
+def test_language_config_indexes_unvalidated_instances():
+    voices = (
+        VoiceOption(voice_name="p", display_name="P", gender="female", age_group="adult", is_premium=True),
+        VoiceOption(voice_name="s", display_name="S", gender="male", age_group="adult"),
+    )
+    config = LanguageConfig.construct_unvalidated(
+        language_code="hi", display_name="Hindi", native_name="Hindi", voice_options=voices,
+    )
+    assert config.get_voice_by_name("p") is voices[0]
+    assert config.get_default_voice() is voices[1]
+
+
+def test_language_config_copy_with_update_reindexes_voices():
+    a = VoiceOption(voice_name="a", display_name="A", gender="female", age_group="adult")
+    b = VoiceOption(voice_name="b", display_name="B", gender="male", age_group="adult")
+    config = LanguageConfig(language_code="hi", display_name="Hindi", native_name="Hindi", voice_options=(a,))
+    assert config.get_default_voice() is a
+    
+    copied = config.model_copy(update={"voice_options": (b,)})
+    assert copied.get_default_voice() is b
+    assert copied.get_voice_by_name("b") is b
+    assert copied.get_voice_by_name("a") is None
+
+
+def _detection(primary, confidence, candidates):
+    return LanguageDetectionResult(
+        primary_language=primary,
+        confidence=confidence,
+        alternative_languages=[
+            LanguageCandidate(language_code=code, language_name=code, confidence=score)
+            for code, score in candidates
+        ],
+        processing_metrics=ProcessingMetrics(processing_time_ms=1.0),
+    )
+
+
+def test_detection_batch_round_trips_exactly():
+    results = [
+        _detection("hi", 0.9, [("ur", 0.3), ("pa", 0.1)]),
+        _detection("en", 0.7, []),
+        _detection("ta", 0.95, [("ml", 0.45)]),
+    ]
+    batch = LanguageDetectionBatchResult.from_results(results, ProcessingMetrics(processing_time_ms=3.0))
+    
+    assert len(batch) == 3
+    assert batch.candidate_offsets.tolist() == [0, 2, 2, 3]
+    assert batch.confident_mask(0.9).tolist() == [True, False, True]
+    
+    expanded = batch.to_individual_results()
+    # Expanded results carry the batch's metrics; everything else must match
+    exclude = {"processing_metrics"}
+    assert [r.model_dump(exclude=exclude) for r in expanded] == [r.model_dump(exclude=exclude) for r in results]
+    assert expanded[0].is_confident(0.9)
+
+
+def test_detection_batch_expansion_filters_candidates_by_threshold():
+    results = [
+        _detection("hi", 0.9, [("ur", 0.3), ("pa", 0.1)]),
+        _detection("ta", 0.95, [("ml", 0.45)]),
+    ]
+    batch = LanguageDetectionBatchResult.from_results(results, ProcessingMetrics(processing_time_ms=2.0))
+    expanded = batch.to_individual_results(threshold=0.3)
+    assert [c.language_code for c in expanded[0].alternative_languages] == ["ur"]
+    assert [c.language_code for c in expanded[1].alternative_languages] == ["ml"]
+
+
+def test_detection_batch_rejects_mismatched_offsets():
+    with pytest.raises(ValueError):
+        LanguageDetectionBatchResult(
+            primary_languages=["hi"],
+            primary_confidences=[0.9],
+            candidate_offsets=[0, 2],
+            candidate_codes=["ur"],
+            candidate_names=["ur"],
+            candidate_confidences=[0.3],
+            processing_metrics=ProcessingMetrics(processing_time_ms=1.0),
+        )
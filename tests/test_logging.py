@@ -0,0 +1,10 @@
+"""Tests for structured logging setup."""
+
+import json
+
+from lokvaani.shared.utils.logging import _orjson_dumps
+
+
+def test_orjson_dumps_falls_back_for_wide_ints():
+    event = {"event": "big", "value": 2 ** 80}
+    assert json.loads(_orjson_dumps(event, default=repr)) == event
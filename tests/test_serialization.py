@@ -0,0 +1,114 @@
+"""Tests for Redis serialization utilities."""
+
+import json
+import math
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from enum import Enum
+
+import numpy as np
+import pytest
+
+from lokvaani.shared.utils.exceptions import ProcessingError
+from lokvaani.shared.utils.serialization import (
+    DateTimeEncoder,
+    deserialize_from_redis,
+    safe_deserialize,
+    safe_serialize,
+    serialize_to_redis,
+)
+
+
+def _as_bytes(payload):
+    """Mimic a read through the binary-safe Redis client."""
+    return payload.encode() if isinstance(payload, str) else payload
+
+
+@pytest.mark.parametrize("value", list(range(10)))
+def test_single_digit_json_bytes_round_trip(value):
+    assert safe_deserialize(_as_bytes(safe_serialize(value))) == value
+
+
+@pytest.mark.parametrize("value", [
+    5,
+    -3,
+    "text",
+    [1, 2, 3],
+    {"a": 1, "nested": {"b": [True, None]}},
+    {},
+    [],
+])
+@pytest.mark.parametrize("writer", [
+    pytest.param(lambda data: serialize_to_redis(data), id="json"),
+    pytest.param(lambda data: serialize_to_redis(data, use_msgpack=True), id="msgpack"),
+    pytest.param(lambda data: serialize_to_redis(data, use_pickle=True), id="pickle"),
+    pytest.param(lambda data: safe_serialize(data), id="safe"),
+    pytest.param(lambda data: safe_serialize(data, use_msgpack=True), id="safe-msgpack"),
+])
+def test_safe_deserialize_reads_every_writer_mode(writer, value):
+    assert safe_deserialize(_as_bytes(writer(value))) == value
+
+
+def test_tagged_types_round_trip_through_bytes():
+    data = {
+        "when": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "amount": Decimal("1.50"),
+    }
+    assert safe_deserialize(_as_bytes(safe_serialize(data))) == data
+
+
+def test_pickle_only_types_round_trip():
+    assert safe_deserialize(safe_serialize({1, 2})) == {1, 2}
+
+
+def test_reads_non_finite_floats_written_by_json_dumps():
+    legacy = json.dumps(
+        {"score": float("nan"), "when": datetime(2024, 1, 2, tzinfo=timezone.utc)},
+        cls=DateTimeEncoder,
+    )
+    result = deserialize_from_redis(legacy)
+    assert math.isnan(result["score"])
+    assert result["when"] == datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+
+def test_ints_wider_than_64_bits_round_trip():
+    data = {"big": 2 ** 80, "when": datetime(2024, 1, 2, tzinfo=timezone.utc)}
+    assert deserialize_from_redis(serialize_to_redis(data)) == data
+
+
+@dataclass
+class _Point:
+    x: int
+    y: int
+
+
+class _Color(Enum):
+    RED = 1
+
+
+@pytest.mark.parametrize("value", [
+    uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    _Point(1, 2),
+    _Color.RED,
+    {"nested": [uuid.UUID(int=7), _Color.RED]},
+    {_Color.RED: "enum key"},
+])
+def test_types_json_rejected_round_trip_through_pickle(value):
+    assert safe_deserialize(safe_serialize(value)) == value
+
+
+def test_ndarray_round_trips_through_pickle():
+    array = np.arange(6, dtype=np.float32).reshape(2, 3)
+    restored = safe_deserialize(safe_serialize({"audio": array}))
+    assert restored["audio"].dtype == np.float32
+    np.testing.assert_array_equal(restored["audio"], array)
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), [1.0, float("-inf")]])
+def test_non_finite_floats_are_not_written_as_null(value):
+    with pytest.raises(ProcessingError):
+        serialize_to_redis(value)
+    restored = safe_deserialize(safe_serialize(value))
+    assert repr(restored) == repr(value)
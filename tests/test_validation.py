@@ -0,0 +1,44 @@
+"""Tests for validation utilities."""
+
+import pickle
+
+import pytest
+from pydantic import BaseModel
+
+from lokvaani.shared.utils.exceptions import ModelValidationError, ValidationError
+from lokvaani.shared.utils.validation import validate_language_codes, validate_pydantic_model
+
+
+class _Point(BaseModel):
+    x: int
+
+
+def test_model_validation_error_message():
+    with pytest.raises(ValidationError) as excinfo:
+        validate_pydantic_model(_Point, {"x": "nope"})
+    assert str(excinfo.value).startswith("Validation failed: x: ")
+
+
+def test_model_validation_error_keeps_args_and_pickles():
+    with pytest.raises(ModelValidationError) as excinfo:
+        validate_pydantic_model(_Point, {})
+    error = excinfo.value
+    assert error.args == (error.pydantic_error,)
+    assert repr(error).startswith("ModelValidationError(")
+    restored = pickle.loads(pickle.dumps(error))
+    assert str(restored) == str(error)
+
+
+def test_validate_language_codes_canonicalizes():
+    assert validate_language_codes(["en-us", " hi ", "ta-IN"]) == ["en-US", "hi", "ta-IN"]
+
+
+@pytest.mark.parametrize("codes", [["en", ""], ["en", None]])
+def test_validate_language_codes_rejects_empty_items(codes):
+    with pytest.raises(ValidationError, match="Language code cannot be empty"):
+        validate_language_codes(codes)
+
+
+def test_validate_language_codes_reports_offenders_with_repr():
+    with pytest.raises(ValidationError, match="Unsupported language codes: '', 'xx'"):
+        validate_language_codes(["en", "   ", "xx"])
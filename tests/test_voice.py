@@ -0,0 +1,92 @@
+"""Tests for voice models and audio blob storage."""
+
+import pytest
+import redis
+from pydantic import ValidationError as PydanticValidationError
+
+from lokvaani.shared.database.blob_store import AudioBlobStore
+from lokvaani.shared.models.base import ProcessingMetrics
+from lokvaani.shared.models.voice import VoiceInteraction
+from lokvaani.shared.utils.exceptions import ExternalServiceError
+
+
+class _DictRedis:
+    """In-memory stand-in for the few binary client calls AudioBlobStore makes."""
+    
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+    
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+        self.ttls[key] = ex
+    
+    def get(self, key):
+        return self.data.get(key)
+    
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+class _BrokenRedis:
+    """Client whose every call fails as if Redis were unreachable."""
+    
+    def _fail(self, *args, **kwargs):
+        raise redis.ConnectionError("down")
+    
+    set = get = delete = _fail
+
+
+def _interaction(**overrides):
+    fields = dict(
+        interaction_id="i-1",
+        session_id="s-1",
+        input_type="voice",
+        input_data_ref="audio:in",
+        processed_text="hello",
+        detected_language="en",
+        response_text="hi",
+        processing_metrics=ProcessingMetrics(processing_time_ms=1.0),
+    )
+    fields.update(overrides)
+    return VoiceInteraction(**fields)
+
+
+def test_blob_store_round_trip():
+    client = _DictRedis()
+    store = AudioBlobStore(client=client, ttl_seconds=60)
+    
+    key = store.put(b"\x00audio")
+    assert key.startswith(AudioBlobStore.KEY_PREFIX)
+    assert client.ttls[key] == 60
+    assert store.get(key) == b"\x00audio"
+    
+    store.delete(key)
+    assert store.get(key) is None
+
+
+def test_blob_store_wraps_redis_errors():
+    store = AudioBlobStore(client=_BrokenRedis(), ttl_seconds=60)
+    with pytest.raises(ExternalServiceError):
+        store.put(b"audio")
+    with pytest.raises(ExternalServiceError):
+        store.get("audio:missing")
+
+
+def test_interaction_refs_resolve_through_blob_store():
+    store = AudioBlobStore(client=_DictRedis(), ttl_seconds=60)
+    interaction = _interaction(
+        input_data_ref=store.put(b"input"),
+        response_audio_ref=store.put(b"response"),
+    )
+    restored = VoiceInteraction.model_validate_json(interaction.model_dump_json())
+    
+    assert restored.has_audio_response()
+    assert store.get(restored.input_data_ref) == b"input"
+    assert store.get(restored.response_audio_ref) == b"response"
+
+
+@pytest.mark.parametrize("legacy_field", ["input_data", "response_audio"])
+def test_interaction_rejects_inline_payloads(legacy_field):
+    with pytest.raises(PydanticValidationError, match=f"{legacy_field}_ref"):
+        _interaction(**{legacy_field: b"audio"})